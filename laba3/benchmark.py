@@ -0,0 +1,97 @@
+import time
+
+import numpy as np
+
+from main import bresenham_line, bresenham_line_batch, draw_line, thick_line_batch, visible_steps, wu_line_batch
+
+
+def random_segments(n, span=16, size=1000, seed=0):
+    """Случайные отрезки: начало в квадрате size x size, длина до span пикселей"""
+    rng = np.random.default_rng(seed)
+    start = rng.integers(0, size, (n, 2))
+    end = start + rng.integers(-span, span + 1, (n, 2))
+    return np.hstack([start, end])
+
+
+def check_same_pixels(segments):
+    """Проверяет, что пакетный вариант даёт те же пиксели, что и bresenham_line"""
+    pixels, offsets = bresenham_line_batch(segments)
+    for i, (x0, y0, x1, y1) in enumerate(segments.tolist()):
+        expected = bresenham_line(x0, y0, x1, y1)
+        got = list(map(tuple, pixels[offsets[i]:offsets[i + 1]].tolist()))
+        if got != expected:
+            raise AssertionError(f"Отрезок {i} {(x0, y0, x1, y1)}: {got} != {expected}")
+
+
+def check_clipped(n=10 ** 4, width=40, height=30, seed=0):
+    """Проверяет, что visible_steps оставляет ровно пиксели отрезков внутри кадра,
+    и рисует длинный отрезок, видимый лишь на ширину кадра"""
+    rng = np.random.default_rng(seed)
+    segments = rng.integers(-60, 100, (n, 4))
+    segments[::7, 3] = segments[::7, 1]  # горизонтальные
+    segments[::11, 2] = segments[::11, 0]  # вертикальные
+    segments[::13, 2:] = segments[::13, :2]  # точки
+    pixels, offsets = bresenham_line_batch(segments)
+    inside = (pixels[:, 0] >= 0) & (pixels[:, 0] < width) & (pixels[:, 1] >= 0) & (pixels[:, 1] < height)
+    clipped, clipped_offsets = bresenham_line_batch(segments, steps=visible_steps(segments, width, height))
+    for i in range(n):
+        expected = pixels[offsets[i]:offsets[i + 1]][inside[offsets[i]:offsets[i + 1]]]
+        if not np.array_equal(clipped[clipped_offsets[i]:clipped_offsets[i + 1]], expected):
+            raise AssertionError(f"Отрезок {i} {segments[i].tolist()}: обрезка по кадру потеряла пиксели")
+
+    t0 = time.perf_counter()
+    frame = draw_line(np.zeros((100, 100), np.uint8), -10 ** 7, 50, 10 ** 7, 50)
+    print(f"Отрезок длиной 2e7 в кадре 100x100: {int(frame.sum())} пикселей за {time.perf_counter() - t0:.4f} с")
+
+
+def benchmark(sizes=(10 ** 3, 10 ** 5, 10 ** 7), scalar_limit=10 ** 4):
+    """Сравнивает время bresenham_line и bresenham_line_batch.
+
+    Поштучный вариант на больших N не запускается целиком: время измеряется
+    на первых scalar_limit отрезках и пересчитывается линейно.
+    """
+    print(f"{'N':>10} {'пикселей':>12} {'поштучно, с':>14} {'пакетно, с':>12} {'ускорение':>10}")
+    for n in sizes:
+        segments = random_segments(n)
+        sample = segments[:scalar_limit]
+        check_same_pixels(sample[:1000])
+
+        t0 = time.perf_counter()
+        for x0, y0, x1, y1 in sample.tolist():
+            bresenham_line(x0, y0, x1, y1)
+        scalar = (time.perf_counter() - t0) * n / len(sample)
+
+        t0 = time.perf_counter()
+        pixels, _ = bresenham_line_batch(segments)
+        batch = time.perf_counter() - t0
+
+        mark = "*" if len(sample) < n else " "
+        print(f"{n:>10} {len(pixels):>12} {scalar:>13.3f}{mark} {batch:>12.3f} {scalar / batch:>9.1f}x")
+    print("* - оценка по первым", scalar_limit, "отрезкам")
+
+
+def benchmark_variants(n=10 ** 6, width=3, chunk_size=1 << 14):
+    """Время на отрезок для обычных, сглаженных (Ву) и толстых отрезков.
+
+    Отрезки подаются частями по chunk_size, как это делают функции draw_*.
+    """
+    segments = random_segments(n)
+    variants = [
+        ("Брезенхем", lambda chunk: bresenham_line_batch(chunk)),
+        ("Ву", lambda chunk: wu_line_batch(chunk)),
+        (f"толщина {width}", lambda chunk: thick_line_batch(chunk, width)),
+    ]
+    print(f"\n{'вариант':>12} {'пикселей':>12} {'нс/отрезок':>12}")
+    for name, run in variants:
+        count = 0
+        t0 = time.perf_counter()
+        for start in range(0, n, chunk_size):
+            count += len(run(segments[start:start + chunk_size])[0])
+        elapsed = time.perf_counter() - t0
+        print(f"{name:>12} {count:>12} {elapsed / n * 1e9:>12.0f}")
+
+
+if __name__ == "__main__":
+    check_clipped()
+    benchmark()
+    benchmark_variants()
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plt
+import numpy as np
 
 
 def bresenham_line(x0, y0, x1, y1):
@@ -33,6 +34,105 @@ def bresenham_line(x0, y0, x1, y1):
     return points
 
 
+def bresenham_line_batch(segments, chunk_size=1 << 14, steps=None):
+    """Пакетный вариант bresenham_line для массива отрезков.
+
+    segments: массив (N, 4) целых чисел (x0, y0, x1, y1).
+    Возвращает (pixels, offsets): pixels - массив (K, 2) int32 с координатами
+    всех пикселей подряд, offsets - массив (N + 1,) int64, пиксели отрезка i
+    лежат в pixels[offsets[i]:offsets[i + 1]]. steps=(first, last) - строить
+    только шаги first..last каждого отрезка (см. visible_steps).
+
+    Вместо пошагового накопления ошибки используется замкнутая формула:
+    на шаге i по главной оси смещение по второй оси равно
+    (2 * i * minor + major) // (2 * major). Она даёт ровно те же пиксели
+    и в том же порядке, что и bresenham_line.
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    x0, y0, x1, y1 = segments.T
+    dx = np.abs(x1 - x0)
+    dy = np.abs(y1 - y0)
+    sx = np.where(x0 < x1, 1, -1)
+    sy = np.where(y0 < y1, 1, -1)
+    x_major = dx >= dy
+    major = np.maximum(dx, dy)
+    minor = np.minimum(dx, dy)
+
+    # Шаг по главной оси (ax, ay) и по второй оси (bx, by) для каждого отрезка
+    ax, ay = np.where(x_major, sx, 0), np.where(x_major, 0, sy)
+    bx, by = np.where(x_major, 0, sx), np.where(x_major, sy, 0)
+
+    first, last = (np.zeros_like(major), major) if steps is None else steps
+    offsets = np.zeros(len(segments) + 1, dtype=np.int64)
+    np.cumsum(np.maximum(last - first + 1, 0), out=offsets[1:])
+    pixels = np.empty((offsets[-1], 2), dtype=np.int32)
+
+    # Если 2 * major ** 2 помещается в int32, считаем попиксельно в int32:
+    # это вдвое меньше памяти и заметно быстрее целочисленного деления
+    small = len(segments) == 0 or 2 * int(major.max()) ** 2 < 2 ** 31
+    work = np.int32 if small else np.int64
+
+    # Считаем по частям, чтобы временные массивы не росли вместе с N
+    for start in range(0, len(segments), chunk_size):
+        stop = min(start + chunk_size, len(segments))
+        counts = np.maximum(last[start:stop] - first[start:stop] + 1, 0)
+        total = int(offsets[stop] - offsets[start])
+
+        def rep(values):
+            return np.repeat(values[start:stop].astype(work), counts)
+
+        local = (offsets[start:stop] - offsets[start]).astype(work)
+        i = np.arange(total, dtype=work) - np.repeat(local, counts) + rep(first)
+        m = rep(major)
+        j = (2 * i * rep(minor) + m) // np.maximum(2 * m, 1)
+
+        out = pixels[offsets[start]:offsets[stop]]
+        out[:, 0] = rep(x0) + rep(ax) * i + rep(bx) * j
+        out[:, 1] = rep(y0) + rep(ay) * i + rep(by) * j
+
+    return pixels, offsets
+
+
+def visible_steps(segments, width, height):
+    """Шаги first..last отрезков Брезенхема (N, 4), пиксели которых лежат в кадре width x height.
+
+    Координата по главной оси на шаге i равна x0 + sx * i, по второй оси
+    монотонна по i (j = (2 * i * minor + major) // (2 * major)), поэтому
+    видимые шаги - отрезок, и его концы находятся точно из неравенств.
+    У невидимых отрезков last < first.
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    x0, y0, x1, y1 = segments.T
+    dx, dy = np.abs(x1 - x0), np.abs(y1 - y0)
+    x_major = dx >= dy
+    major, minor = np.maximum(dx, dy), np.minimum(dx, dy)
+
+    def window(start, step_sign, size):
+        """Значения k >= 0 с 0 <= start + step_sign * k < size"""
+        low = np.where(step_sign > 0, -start, start - size + 1)
+        high = np.where(step_sign > 0, size - 1 - start, start)
+        return low, high
+
+    sx, sy = np.where(x0 < x1, 1, -1), np.where(y0 < y1, 1, -1)
+    # Главная ось: шаг i
+    first, last = window(np.where(x_major, x0, y0), np.where(x_major, sx, sy), np.where(x_major, width, height))
+    first, last = np.maximum(first, 0), np.minimum(last, major)
+    # Вторая ось: смещение j в [j_low, j_high] (j от 0 до minor)
+    j_low, j_high = window(np.where(x_major, y0, x0), np.where(x_major, sy, sx), np.where(x_major, height, width))
+    j_low, j_high = np.maximum(j_low, 0), np.minimum(j_high, minor)
+    # j(i) >= j_low при 2 * i * minor >= (2 * j_low - 1) * major, j(i) <= j_high при
+    # 2 * i * minor < (2 * j_high + 1) * major
+    divisor = np.maximum(2 * minor, 1)
+    i_low = -((major - 2 * j_low * major) // divisor)
+    i_high = ((2 * j_high + 1) * major - 1) // divisor
+    flat = minor == 0
+    i_low = np.where(flat, np.where(j_low <= 0, 0, major + 1), i_low)
+    i_high = np.where(flat, np.where(j_high >= 0, major, -1), i_high)
+    first = np.maximum(first, np.maximum(i_low, 0))
+    last = np.minimum(last, i_high)
+    return first, last
+
+
 # Пример использования:
 
 
@@ -61,6 +161,350 @@ def bresenham_circle(cx, cy, r):
     return points
 
 
+def bresenham_circle_octant(r):
+    """Узлы окружности Брезенхема во втором октанте (0 <= x <= y) в виде массивов.
+
+    Та же последовательность точек, что строит цикл в bresenham_circle,
+    но без пошагового цикла: при x >= 1 выбранное значение y - это наибольшее
+    целое t, для которого t * t - t <= r * r - x * x - 1.
+    """
+    x = np.arange(int(r / np.sqrt(2)) + 2, dtype=np.int64)
+    rest = r * r - x * x - 1
+    y = ((1 + np.sqrt(np.maximum(4 * rest + 1, 0))) // 2).astype(np.int64)
+    # Поправка на погрешность sqrt
+    y -= y * y - y > rest
+    y += (y + 1) * y <= rest
+    y[0] = r
+    keep = x <= y
+    return x[keep], y[keep]
+
+
+def bresenham_circle_points(cx, cy, r):
+    """Узлы окружности Брезенхема массивами (xs, ys) в порядке bresenham_circle"""
+    x, y = bresenham_circle_octant(r)
+    xs = np.stack([cx + x, cx - x, cx + x, cx - x, cx + y, cx - y, cx + y, cx - y], axis=1)
+    ys = np.stack([cy + y, cy + y, cy - y, cy - y, cy + x, cy + x, cy - x, cy - x], axis=1)
+    return xs.ravel(), ys.ravel()
+
+
+def plot_pixels(framebuffer, xs, ys, value=1):
+    """Записывает value в пиксели (xs, ys) кадра framebuffer[y, x].
+
+    Пиксели за пределами кадра отбрасываются. value - число или массив
+    той же длины, что и xs (цвет каждого пикселя).
+    """
+    height, width = framebuffer.shape[:2]
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    if np.ndim(value) > 0:
+        value = np.asarray(value)[inside]
+    framebuffer[ys[inside], xs[inside]] = value
+
+
+def draw_line(framebuffer, x0, y0, x1, y1, value=1):
+    """Рисует отрезок Брезенхема прямо в массив кадра (например, uint8 или uint32).
+
+    Строятся только пиксели внутри кадра (visible_steps).
+    """
+    height, width = framebuffer.shape[:2]
+    segment = [(x0, y0, x1, y1)]
+    pixels, _ = bresenham_line_batch(segment, steps=visible_steps(segment, width, height))
+    plot_pixels(framebuffer, pixels[:, 0], pixels[:, 1], value)
+    return framebuffer
+
+
+def draw_lines(framebuffer, segments, value=1, chunk_size=1 << 16):
+    """Рисует массив отрезков (N, 4) в кадр; value - число или цвет каждого отрезка.
+
+    Отрезки обрабатываются частями и заранее обрезаются по кадру (visible_steps),
+    так что память под координаты пикселей ограничена размером части и
+    видимыми пикселями, а не длиной отрезков.
+    """
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 4)
+    height, width = framebuffer.shape[:2]
+    for start in range(0, len(segments), chunk_size):
+        chunk = segments[start:start + chunk_size]
+        pixels, offsets = bresenham_line_batch(chunk, steps=visible_steps(chunk, width, height))
+        color = value
+        if np.ndim(value) > 0:
+            color = np.repeat(np.asarray(value)[start:start + chunk_size], np.diff(offsets))
+        plot_pixels(framebuffer, pixels[:, 0], pixels[:, 1], color)
+    return framebuffer
+
+
+def draw_circle(framebuffer, cx, cy, r, value=1):
+    """Рисует окружность Брезенхема прямо в массив кадра"""
+    xs, ys = bresenham_circle_points(cx, cy, r)
+    plot_pixels(framebuffer, xs, ys, value)
+    return framebuffer
+
+
+def disc_half_widths(r):
+    """Полуширина закрашенного круга радиуса r в строках 0..r от центра.
+
+    Строка v круга - это отрезок [cx - w[v], cx + w[v]], где крайние пиксели
+    совпадают с узлами окружности Брезенхема, поэтому контур bresenham_circle
+    целиком лежит внутри заливки.
+    """
+    x, y = bresenham_circle_octant(r)
+    w = np.zeros(r + 1, dtype=np.int64)
+    w[x] = y
+    np.maximum.at(w, y, x)
+    return w
+
+
+def circle_inner_half_widths(r):
+    """Полуширина внутренней части круга в строках 0..r: пиксели |x| < g[v].
+
+    В верхних строках окружность занимает несколько соседних пикселей,
+    поэтому внутренняя часть строки уже, чем заливка минус два крайних пикселя.
+    """
+    x, y = bresenham_circle_octant(r)
+    g = np.full(r + 1, r + 1, dtype=np.int64)
+    g[x] = y
+    np.minimum.at(g, y, x)
+    return g
+
+
+def disc_spans(circles):
+    """Горизонтальные отрезки (строка, x_начала, x_конца) для закрашенных кругов.
+
+    circles: массив (N, 3) - (cx, cy, r). На каждую строку круга приходится
+    ровно один отрезок, пиксели не повторяются. Возвращает (spans, offsets):
+    отрезки круга i лежат в spans[offsets[i]:offsets[i + 1]].
+    Круги одного радиуса обрабатываются вместе, так что цикл идёт только
+    по различным радиусам.
+    """
+    circles = np.asarray(circles, dtype=np.int64).reshape(-1, 3)
+    cx, cy, r = circles.T
+    offsets = np.zeros(len(circles) + 1, dtype=np.int64)
+    np.cumsum(2 * r + 1, out=offsets[1:])
+    spans = np.empty((offsets[-1], 3), dtype=np.int64)
+
+    for radius in np.unique(r).tolist():
+        sel = np.flatnonzero(r == radius)
+        v = np.arange(-radius, radius + 1)
+        w = disc_half_widths(radius)[np.abs(v)]
+        pos = offsets[sel, None] + np.arange(2 * radius + 1)
+        spans[pos, 0] = cy[sel, None] + v
+        spans[pos, 1] = cx[sel, None] - w
+        spans[pos, 2] = cx[sel, None] + w
+    return spans, offsets
+
+
+def ring_spans(rings):
+    """Горизонтальные отрезки для колец (cx, cy, r_inner, r_outer).
+
+    Обе окружности входят в кольцо, внутренняя часть меньшего круга
+    (без его контура) - нет. В строках, которые пересекают внутренний круг, кольцо
+    даёт два отрезка, в остальных - один (при r_inner == r_outer == 0 правый
+    отрезок пустой: x_начала > x_конца). Формат результата как у disc_spans.
+    """
+    rings = np.asarray(rings, dtype=np.int64).reshape(-1, 4)
+    cx, cy, r_in, r_out = rings.T
+    if np.any(r_in > r_out) or np.any(r_in < 0):
+        raise ValueError("Нужно 0 <= r_inner <= r_outer")
+    offsets = np.zeros(len(rings) + 1, dtype=np.int64)
+    np.cumsum(2 * r_out + 2 * r_in + 2, out=offsets[1:])
+    spans = np.empty((offsets[-1], 3), dtype=np.int64)
+
+    for inner, outer in np.unique(rings[:, 2:], axis=0).tolist():
+        sel = np.flatnonzero((r_in == inner) & (r_out == outer))
+        w_out = disc_half_widths(outer)
+        w_in = circle_inner_half_widths(inner)
+
+        # Строки вне внутреннего круга: один отрезок на всю ширину
+        v = np.arange(-outer, outer + 1)
+        v = v[np.abs(v) > inner]
+        # Строки внутреннего круга: слева и справа от него
+        u = np.arange(-inner, inner + 1)
+        wi = w_in[np.abs(u)]
+        wo = w_out[np.abs(u)]
+
+        rows = np.concatenate([v, u, u])
+        starts = np.concatenate([-w_out[np.abs(v)], -wo, wi + (wi == 0)])
+        ends = np.concatenate([w_out[np.abs(v)], -wi, wo])
+
+        pos = offsets[sel, None] + np.arange(len(rows))
+        spans[pos, 0] = cy[sel, None] + rows
+        spans[pos, 1] = cx[sel, None] + starts
+        spans[pos, 2] = cx[sel, None] + ends
+    return spans, offsets
+
+
+def fill_spans(framebuffer, spans, value=1):
+    """Закрашивает отрезки (строка, x_начала, x_конца) срезами framebuffer[y, a:b + 1]"""
+    height, width = framebuffer.shape[:2]
+    rows, starts, ends = np.asarray(spans, dtype=np.int64).reshape(-1, 3).T
+    starts = np.maximum(starts, 0)
+    ends = np.minimum(ends, width - 1)
+    keep = (rows >= 0) & (rows < height) & (starts <= ends)
+    for row, a, b in zip(rows[keep].tolist(), starts[keep].tolist(), ends[keep].tolist()):
+        framebuffer[row, a:b + 1] = value
+    return framebuffer
+
+
+def fill_discs(framebuffer, circles, value=1):
+    """Рисует закрашенные круги (N, 3) в кадр"""
+    spans, _ = disc_spans(circles)
+    return fill_spans(framebuffer, spans, value)
+
+
+def fill_rings(framebuffer, rings, value=1):
+    """Рисует кольца (N, 4) в кадр"""
+    spans, _ = ring_spans(rings)
+    return fill_spans(framebuffer, spans, value)
+
+
+def _major_axis_form(segments):
+    """Приводит отрезки к виду «главная ось - x, x0 <= x1».
+
+    Возвращает (x0, y0, x1, y1, steep): для крутых отрезков (|dy| > |dx|)
+    координаты переставлены, и результат надо переставить обратно.
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    x0, y0, x1, y1 = segments.T
+    steep = np.abs(y1 - y0) > np.abs(x1 - x0)
+    x0, y0 = np.where(steep, y0, x0), np.where(steep, x0, y0)
+    x1, y1 = np.where(steep, y1, x1), np.where(steep, x1, y1)
+    back = x0 > x1
+    x0, x1 = np.where(back, x1, x0), np.where(back, x0, x1)
+    y0, y1 = np.where(back, y1, y0), np.where(back, y0, y1)
+    return x0, y0, x1, y1, steep
+
+
+def _columns(first, last):
+    """Номера столбцов first..last каждого отрезка подряд: (сегмент, столбец, смещения)"""
+    counts = (last - first + 1).astype(np.int64)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    seg = np.repeat(np.arange(len(counts)), counts)
+    k = np.arange(offsets[-1]) - np.repeat(offsets[:-1], counts)
+    return seg, k, offsets
+
+
+def wu_line_batch(segments):
+    """Сглаженные отрезки алгоритмом Ву для массива (N, 4) вещественных концов.
+
+    В каждом столбце главной оси закрашиваются два соседних пикселя,
+    яркость делится между ними пропорционально расстоянию до идеальной прямой.
+    Крайние столбцы дополнительно умножаются на долю пикселя, покрытую отрезком.
+    Возвращает (pixels, alpha, offsets): int32 координаты (K, 2), покрытие
+    в [0, 1] и смещения отрезков, как у bresenham_line_batch.
+    """
+    x0, y0, x1, y1, steep = _major_axis_form(segments)
+    dx = x1 - x0
+    gradient = np.where(dx == 0, 1.0, (y1 - y0) / np.where(dx == 0, 1.0, dx))
+
+    first = np.floor(x0 + 0.5)
+    last = np.floor(x1 + 0.5)
+    gap_first = 1 - (x0 + 0.5 - first)
+    gap_last = x1 + 0.5 - last
+
+    seg, k, col_offsets = _columns(first, last)
+    x = first[seg] + k
+    y = y0[seg] + gradient[seg] * (x - x0[seg])
+    iy = np.floor(y)
+    fy = y - iy
+
+    weight = np.ones(len(x))
+    starts, ends = col_offsets[:-1], col_offsets[1:] - 1
+    weight[starts] = gap_first
+    weight[ends] = gap_last
+    single = starts == ends
+    weight[starts[single]] = np.clip(gap_first[single] + gap_last[single] - 1, 0, 1)
+
+    major = np.repeat(x, 2)
+    minor = np.stack([iy, iy + 1], axis=1).ravel()
+    alpha = np.stack([(1 - fy) * weight, fy * weight], axis=1).ravel()
+    swap = np.repeat(steep[seg], 2)
+    pixels = np.empty((len(major), 2), dtype=np.int32)
+    pixels[:, 0] = np.where(swap, minor, major)
+    pixels[:, 1] = np.where(swap, major, minor)
+    return pixels, alpha, 2 * col_offsets
+
+
+def thick_line_batch(segments, width):
+    """Отрезки толщиной width пикселей со сглаженными краями.
+
+    Покрытие пикселя считается по расстоянию от его центра до осевой линии:
+    поперёк - clip(width / 2 + 0.5 - расстояние, 0, 1), вдоль - так же
+    относительно торцов (торцы плоские). Пиксели с нулевым покрытием
+    отбрасываются. Формат результата как у wu_line_batch.
+    """
+    x0, y0, x1, y1, steep = _major_axis_form(segments)
+    dx, dy = x1 - x0, y1 - y0
+    length = np.hypot(dx, dy)
+    ux = np.where(length > 0, dx / np.where(length > 0, length, 1), 1.0)
+    uy = np.where(length > 0, dy / np.where(length > 0, length, 1), 0.0)
+    half = width / 2
+
+    # Ненулевое покрытие возможно лишь в полосе |y - ось| < (half + 0.5) / ux
+    # и не дальше (half + 0.5) * |uy| + 0.5 от торцов по главной оси
+    extent = (half + 0.5) * np.abs(uy) + 0.5
+    first = np.floor(x0 - extent)
+    last = np.ceil(x1 + extent)
+    gradient = uy / ux
+    reach = (half + 0.5) / ux
+    rows = int(np.ceil(2 * reach.max(initial=0) + 1))
+
+    # Кандидаты - сетка (строка полосы, столбец): массивы по столбцам (1, C)
+    # транслируются на номера строк (rows, 1), длинная ось - столбцы
+    seg, k, _ = _columns(first, last)
+    x = first[seg] + k
+    y_axis = y0[seg] + gradient[seg] * (x - x0[seg])
+    low = np.floor(y_axis - reach[seg])
+    ux_c, uy_c = ux[seg], uy[seg]
+    j = np.arange(rows, dtype=np.float64)[:, None]
+
+    across = np.abs(j + (low - y_axis)) * ux_c
+    along = j * uy_c + ((x - x0[seg]) * ux_c + (low - y0[seg]) * uy_c)
+    alpha = np.clip(half + 0.5 - across, 0, 1)
+    alpha *= np.clip(along + 0.5, 0, 1)
+    alpha *= np.clip(length[seg] - along + 0.5, 0, 1)
+
+    # Транспонируем маску, чтобы пиксели шли по столбцам, а значит по отрезкам
+    col, row = np.nonzero(np.ascontiguousarray((alpha > 0).T))
+    alpha = alpha[row, col]
+    seg = seg[col]
+    px, py = x[col], low[col] + row
+    swap = steep[seg]
+    pixels = np.empty((len(col), 2), dtype=np.int32)
+    pixels[:, 0] = np.where(swap, py, px)
+    pixels[:, 1] = np.where(swap, px, py)
+    offsets = np.zeros(len(x0) + 1, dtype=np.int64)
+    np.cumsum(np.bincount(seg, minlength=len(x0)), out=offsets[1:])
+    return pixels, alpha, offsets
+
+
+def blend_pixels(framebuffer, xs, ys, alpha):
+    """Смешивает покрытие alpha с вещественным кадром: берётся максимум.
+
+    Максимум, а не сумма, чтобы пересечения и стыки отрезков не давали
+    пересвеченных пикселей. Пиксели вне кадра отбрасываются.
+    """
+    height, width = framebuffer.shape[:2]
+    inside = (xs >= 0) & (xs < width) & (ys >= 0) & (ys < height)
+    np.maximum.at(framebuffer, (ys[inside], xs[inside]), alpha[inside])
+
+
+def draw_lines_aa(framebuffer, segments, value=1.0, chunk_size=1 << 16):
+    """Рисует сглаженные (Ву) отрезки (N, 4) в вещественный кадр"""
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    for start in range(0, len(segments), chunk_size):
+        pixels, alpha, _ = wu_line_batch(segments[start:start + chunk_size])
+        blend_pixels(framebuffer, pixels[:, 0], pixels[:, 1], alpha * value)
+    return framebuffer
+
+
+def draw_thick_lines(framebuffer, segments, width, value=1.0, chunk_size=1 << 14):
+    """Рисует отрезки (N, 4) толщиной width в вещественный кадр"""
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    for start in range(0, len(segments), chunk_size):
+        pixels, alpha, _ = thick_line_batch(segments[start:start + chunk_size], width)
+        blend_pixels(framebuffer, pixels[:, 0], pixels[:, 1], alpha * value)
+    return framebuffer
+
+
 def plot_results(x1, y1, x2, y2, cx, cy, r, mode):
     """Рисует либо отрезок, либо окружность с узлами алгоритма Брезенхема."""
     fig, ax = plt.subplots(figsize=(6, 6))
@@ -82,9 +526,8 @@ def plot_results(x1, y1, x2, y2, cx, cy, r, mode):
         ax.plot([x1, x2], [y1, y2], 'g-', label="Стандартный отрезок")
 
         # Отображаем узлы алгоритма Брезенхема
-        line_points = bresenham_line(x1, y1, x2, y2)
-        x_line, y_line = zip(*line_points)
-        ax.scatter(x_line, y_line, color='red', marker='s', label="Узлы Брезенхема (отрезок)")
+        line_points, _ = bresenham_line_batch([(x1, y1, x2, y2)])
+        ax.scatter(line_points[:, 0], line_points[:, 1], color='red', marker='s', label="Узлы Брезенхема (отрезок)")
 
     elif mode == "circle":
         # Рисуем стандартную окружность
@@ -92,21 +535,21 @@ def plot_results(x1, y1, x2, y2, cx, cy, r, mode):
         ax.add_patch(circle)
 
         # Отображаем узлы алгоритма Брезенхема
-        circle_points = bresenham_circle(cx, cy, r)
-        x_circle, y_circle = zip(*circle_points)
+        x_circle, y_circle = bresenham_circle_points(cx, cy, r)
         ax.scatter(x_circle, y_circle, color='blue', marker='s', label="Узлы Брезенхема (окружность)")
 
     ax.legend()
     plt.show()
 
 
-x1, y1, x2, y2 = 1, 1, 8, 10  # Координаты концов отрезка
-cx, cy, r = 0, 0, 3  # Координаты центра и радиус окружности
+if __name__ == "__main__":
+    x1, y1, x2, y2 = 1, 1, 8, 10  # Координаты концов отрезка
+    cx, cy, r = 0, 0, 3  # Координаты центра и радиус окружности
 
-# Выберите режим: "line" - рисовать отрезок, "circle" - рисовать окружность
-ans = int(input())
-if ans == 1:
-    mode = "line"
-else:
-    mode = "circle"
-plot_results(x1, y1, x2, y2, cx, cy, r, mode)
\ No newline at end of file
+    # Выберите режим: "line" - рисовать отрезок, "circle" - рисовать окружность
+    ans = int(input())
+    if ans == 1:
+        mode = "line"
+    else:
+        mode = "circle"
+    plot_results(x1, y1, x2, y2, cx, cy, r, mode)
@@ -0,0 +1,239 @@
+import bisect
+import json
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from clip_window import ConvexClipWindow
+from clipping import clip_segments, cyrus_beck_clip, cyrus_beck_clip_batch, midpoint_clip_batch, polygon_edges
+
+RECT = (0, 0, 1000, 1000)
+
+
+def make_workload(kind, n, seed=0):
+    """Отрезки (N, 2, 2) с целыми концами для окна RECT.
+
+    inside - оба конца в окне; outside - оба конца вне окна и по одну сторону
+    от него; crossing - один конец внутри, другой снаружи; degenerate -
+    горизонтальные, вертикальные и нулевые отрезки, в том числе на границах.
+    """
+    rng = np.random.default_rng(seed)
+    x_min, y_min, x_max, y_max = RECT
+    if kind == "inside":
+        return rng.integers(x_min, x_max + 1, (n, 2, 2))
+    if kind == "outside":
+        segments = rng.integers(x_max + 1, 3 * x_max, (n, 2, 2))
+        # Переносим на случайную сторону окна
+        side = rng.integers(0, 4, n)
+        segments[side == 1] -= 3 * x_max
+        segments[side == 2, :, 0] -= 2 * x_max
+        segments[side == 3, :, 1] -= 2 * x_max
+        return segments
+    if kind == "crossing":
+        inner = rng.integers(x_min, x_max + 1, (n, 2))
+        outer = rng.integers(-x_max, 2 * x_max, (n, 2))
+        outer[(outer[:, 0] >= x_min) & (outer[:, 0] <= x_max), 1] += 2 * x_max
+        return np.stack([inner, outer], axis=1)
+    if kind == "degenerate":
+        segments = rng.integers(-x_max // 2, x_max + x_max // 2, (n, 2, 2))
+        shape = rng.integers(0, 3, n)
+        segments[shape == 0, 1, 1] = segments[shape == 0, 0, 1]  # горизонтальные
+        segments[shape == 1, 1, 0] = segments[shape == 1, 0, 0]  # вертикальные
+        segments[shape == 2, 1] = segments[shape == 2, 0]  # нулевой длины
+        on_border = rng.random(n) < 0.25
+        segments[on_border & (shape == 0), :, 1] = y_max
+        segments[on_border & (shape == 1), :, 0] = x_min
+        return segments
+    raise ValueError(f"Неизвестная нагрузка: {kind}")
+
+
+def clippers():
+    """Пакетные реализации трёх алгоритмов с общим видом clip(segments) -> (clipped, accepted)"""
+    x_min, y_min, x_max, y_max = RECT
+    polygon = [(x_min, y_min), (x_max, y_min), (x_max, y_max), (x_min, y_max)]
+    edges = polygon_edges(polygon)
+    return {
+        "cohen_sutherland": lambda s: clip_segments(RECT, s),
+        "cyrus_beck": lambda s: cyrus_beck_clip_batch(polygon, s, edges=edges),
+        "midpoint": lambda s: midpoint_clip_batch(RECT, s),
+    }
+
+
+def measure(clip, segments, repeat=3):
+    """Лучшее время из repeat запусков и пик выделенной памяти (tracemalloc)"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = clip(segments)
+        best = min(best, time.perf_counter() - t0)
+    tracemalloc.start()
+    clip(segments)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak, result
+
+
+def agreement(reference, other):
+    """Доля отрезков с одинаковым решением о видимости и расхождение концов (максимум, 99%)"""
+    (ref_clipped, ref_accepted), (clipped, accepted) = reference, other
+    both = ref_accepted & accepted
+    diff = np.abs(ref_clipped[both] - clipped[both]).max(axis=(1, 2)) if both.any() else np.zeros(1)
+    return float(np.mean(ref_accepted == accepted)), float(diff.max()), float(np.percentile(diff, 99))
+
+
+def run_benchmark(n=10 ** 5, workloads=("inside", "outside", "crossing", "degenerate"), repeat=3):
+    """Прогоняет все алгоритмы на всех нагрузках, возвращает список записей-словарей"""
+    records = []
+    for kind in workloads:
+        segments = make_workload(kind, n)
+        results = {}
+        for name, clip in clippers().items():
+            elapsed, peak, results[name] = measure(clip, segments, repeat)
+            records.append({
+                "workload": kind, "algorithm": name, "segments": n,
+                "seconds": elapsed, "segments_per_second": n / elapsed,
+                "peak_bytes": peak, "bytes_per_segment": peak / n,
+                "visible": int(results[name][1].sum()),
+            })
+        # Сравнение с Сазерлендом-Коэном (точный ответ для прямоугольника).
+        # Средняя точка отсекает цифровой отрезок, поэтому у почти параллельных
+        # границе отрезков её концы могут уходить далеко вдоль отрезка
+        for record in records[-len(results):]:
+            same, diff, diff99 = agreement(results["cohen_sutherland"], results[record["algorithm"]])
+            record["agreement"] = same
+            record["max_endpoint_diff"] = diff
+            record["p99_endpoint_diff"] = diff99
+    return records
+
+
+def digital_clip(rect, segment):
+    """Видимая часть цифрового отрезка (как в midpoint_clip_batch) в целых Python или None.
+
+    Короткие отрезки обходятся по всем точкам. У длинных x и y монотонны
+    по номеру точки k, поэтому границы видимых k ищутся bisect по каждой
+    координате отдельно.
+    """
+    x_min, y_min, x_max, y_max = rect
+    (x1, y1), (x2, y2) = [[int(v) for v in p] for p in segment]
+    dx, dy = x2 - x1, y2 - y1
+    length = max(abs(dx), abs(dy), 1)
+
+    def point(k):
+        return x1 + (2 * k * dx + length) // (2 * length), y1 + (2 * k * dy + length) // (2 * length)
+
+    if length <= 10 ** 4:
+        visible = [k for k in range(length + 1) if x_min <= point(k)[0] <= x_max and y_min <= point(k)[1] <= y_max]
+        return (point(visible[0]), point(visible[-1])) if visible else None
+    low, high = 0, length
+    for axis, delta, lo, hi in ((0, dx, x_min, x_max), (1, dy, y_min, y_max)):
+        sign = 1 if delta >= 0 else -1
+        ks = range(length + 1)
+        low = max(low, bisect.bisect_left(ks, sign * (lo if sign > 0 else hi), key=lambda k: sign * point(k)[axis]))
+        high = min(high, bisect.bisect_right(ks, sign * (hi if sign > 0 else lo),
+                                             key=lambda k: sign * point(k)[axis]) - 1)
+    return (point(low), point(high)) if low <= high else None
+
+
+def check_midpoint(n=2000, seed=0):
+    """Сверяет midpoint_clip_batch с digital_clip на всех нагрузках и на концах до 2^31 по модулю"""
+    rng = np.random.default_rng(seed)
+    cases = [make_workload(kind, n, seed) for kind in ("inside", "outside", "crossing", "degenerate")]
+    # Длинные отрезки через окно: длина до 2^32
+    far = rng.integers(-2 ** 31, 2 ** 31, (n, 2, 2))
+    near = rng.integers(RECT[0], RECT[2] + 1, (n, 2))
+    cases.append(np.stack([far[:, 0], 2 * near - far[:, 0]], axis=1).clip(-2 ** 31, 2 ** 31 - 1))
+    cases.append(far)
+    cases.append(np.array([[[-2 ** 30, 50], [2 ** 30, 60]], [[-2 ** 31, 0], [2 ** 31 - 1, 1000]]]))
+    for segments in cases:
+        clipped, accepted = midpoint_clip_batch(RECT, segments)
+        for segment, part, ok in zip(segments, clipped, accepted):
+            expected = digital_clip(RECT, segment)
+            got = (tuple(part[0].tolist()), tuple(part[1].tolist())) if ok else None
+            if got != expected:
+                raise AssertionError(f"midpoint_clip_batch: {segment.tolist()} -> {got}, перебор {expected}")
+    print(f"midpoint_clip_batch совпал с перебором на {sum(len(c) for c in cases)} отрезках")
+
+
+def check_cyrus_beck(n=20000, seed=0):
+    """cyrus_beck_clip, ConvexClipWindow.clip и cyrus_beck_clip_batch дают одинаковые биты.
+
+    Окно - 16-угольник с нецелыми вершинами, отрезки вещественные, среди
+    них отрезок, касающийся вершины.
+    """
+    angles = np.linspace(0, 2 * np.pi, 17)[:-1]
+    polygon = [(150 + 100 * np.cos(a), 100 + 100 * np.sin(a)) for a in angles]
+    segments = np.random.default_rng(seed).uniform(-50, 350, (n, 2, 2))
+    segments[0] = [[250, 100], [200, -200]]
+    clipped, accepted = cyrus_beck_clip_batch(polygon, segments)
+    window = ConvexClipWindow(polygon)
+    for k, segment in enumerate(segments):
+        for name, part in (("cyrus_beck_clip", cyrus_beck_clip(polygon, segment[0], segment[1])[0]),
+                           ("ConvexClipWindow.clip", window.clip(segment))):
+            if (part is not None) != accepted[k] or (
+                    part is not None and not np.array_equal(np.array(part, dtype=np.float64), clipped[k])):
+                raise AssertionError(f"{name} и cyrus_beck_clip_batch расходятся на {segment.tolist()}")
+    print(f"Цирус-Бек: поштучно, окно и пакетно совпали на {n} отрезках")
+
+
+def cold_start(repeat=5):
+    """Время запуска нового интерпретатора с небольшой пакетной задачей отсечения.
+
+    Сравнивает импорт clipping с импортом скрипта лабораторной (он тянет
+    за собой только numpy) и с прежней ценой - загрузкой matplotlib.pyplot.
+    Берётся лучшее из repeat запусков.
+    """
+    job = "clip_segments((0, 0, 10, 10), [((-1, -1), (20, 5))])"
+    commands = {
+        "clipping": f"from clipping import clip_segments; {job}",
+        "script": ("import importlib.util as u; "
+                   "s = u.spec_from_file_location('cs', 'алгоритм Сазерленда-Коэна.py'); "
+                   f"m = u.module_from_spec(s); s.loader.exec_module(m); m.{job}"),
+        "matplotlib": f"import matplotlib.pyplot; from clipping import clip_segments; {job}",
+    }
+    here = os.path.dirname(os.path.abspath(__file__))
+    timings = {}
+    for name, code in commands.items():
+        best = float("inf")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            subprocess.run([sys.executable, "-c", code], cwd=here, check=True)
+            best = min(best, time.perf_counter() - t0)
+        timings[name] = best
+    return timings
+
+
+def environment():
+    """Сведения для сравнения результатов между версиями"""
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {"commit": commit, "numpy": np.__version__, "python": sys.version.split()[0],
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S")}
+
+
+if __name__ == "__main__":
+    check_midpoint()
+    check_cyrus_beck()
+    records = run_benchmark()
+    print(f"{'нагрузка':>11} {'алгоритм':>17} {'отр/с':>12} {'байт/отр':>9} {'совпадение':>11} "
+          f"{'расх.':>7} {'99%':>6}")
+    for r in records:
+        print(f"{r['workload']:>11} {r['algorithm']:>17} {r['segments_per_second']:>12.0f} "
+              f"{r['bytes_per_segment']:>9.0f} {r['agreement']:>11.4f} {r['max_endpoint_diff']:>7.2f} "
+              f"{r['p99_endpoint_diff']:>6.2f}")
+
+    starts = cold_start()
+    print("\nЗапуск с нуля, с: " + ", ".join(f"{k} {v:.3f}" for k, v in starts.items()))
+
+    report = {"environment": environment(), "results": records, "cold_start": starts}
+    if len(sys.argv) > 1:
+        with open(sys.argv[1], "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+    else:
+        print(json.dumps(report, ensure_ascii=False))
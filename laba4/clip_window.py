@@ -0,0 +1,82 @@
+import numpy as np
+
+from clipping import clip_segments, cyrus_beck_clip_batch, polygon_edges, sutherland_cohen_clip
+
+
+class ClipWindow:
+    """Прямоугольное окно отсечения (Сазерленд-Коэн) с заранее разобранными границами"""
+
+    def __init__(self, rect):
+        x_min, y_min, x_max, y_max = rect
+        if x_min > x_max or y_min > y_max:
+            raise ValueError("Окно отсечения: нужно x_min <= x_max и y_min <= y_max")
+        self.rect = (x_min, y_min, x_max, y_max)
+
+    def clip(self, segment):
+        """Видимая часть отрезка ((x1, y1), (x2, y2)) или None"""
+        clipped, _ = sutherland_cohen_clip(self.rect, *segment)
+        return clipped
+
+    def clip_many(self, segments):
+        """Отсечение массива отрезков (N, 2, 2): (clipped, accepted), как clip_segments"""
+        return clip_segments(self.rect, segments)
+
+
+class ConvexClipWindow:
+    """Выпуклое окно отсечения (Цирус-Бек) с заранее вычисленными нормалями сторон.
+
+    Многоугольник проверяется на выпуклость; вершины, заданные по часовой
+    стрелке, разворачиваются, чтобы нормали (-ey, ex) смотрели внутрь.
+    """
+
+    def __init__(self, polygon):
+        vertices = np.asarray(polygon, dtype=np.float64)
+        if vertices.ndim != 2 or vertices.shape[1] != 2 or len(vertices) < 3:
+            raise ValueError("Окно отсечения: нужен многоугольник хотя бы из трёх вершин")
+
+        edges = np.roll(vertices, -1, axis=0) - vertices
+        following = np.roll(edges, -1, axis=0)
+        turns = edges[:, 0] * following[:, 1] - edges[:, 1] * following[:, 0]
+        dots = edges[:, 0] * following[:, 0] + edges[:, 1] * following[:, 1]
+        # Все повороты в одну сторону и ровно один оборот (иначе это звезда)
+        winding = np.sum(np.arctan2(turns, dots)) / (2 * np.pi)
+        if ((turns > 0).any() and (turns < 0).any()) or not np.isclose(abs(winding), 1):
+            raise ValueError("Окно отсечения: многоугольник не выпуклый")
+        area = np.sum(vertices[:, 0] * np.roll(vertices, -1, axis=0)[:, 1]
+                      - np.roll(vertices, -1, axis=0)[:, 0] * vertices[:, 1])
+        if area == 0:
+            raise ValueError("Окно отсечения: вырожденный многоугольник")
+        if area < 0:
+            vertices = vertices[::-1].copy()
+
+        self.polygon = vertices
+        self.edges = polygon_edges(vertices)
+        # Те же числа обычными float для поштучного clip без накладных расходов numpy
+        self._edge_list = [(sx, sy, nx, ny) for (sx, sy), (nx, ny)
+                           in zip(self.edges[0].tolist(), self.edges[1].tolist())]
+
+    def clip(self, segment):
+        """Видимая часть отрезка ((x1, y1), (x2, y2)) или None"""
+        (x1, y1), (x2, y2) = segment
+        dx, dy = x2 - x1, y2 - y1
+        t_enter, t_leave = 0, 1
+        for sx, sy, nx, ny in self._edge_list:
+            num = nx * (x1 - sx) + ny * (y1 - sy)
+            den = nx * dx + ny * dy
+            if den == 0:
+                if num < 0:
+                    return None
+                continue
+            t = -num / den
+            if den > 0:
+                t_enter = max(t_enter, t)
+            else:
+                t_leave = min(t_leave, t)
+        if t_enter > t_leave:
+            return None
+        return ((x1 + t_enter * dx, y1 + t_enter * dy),
+                (x1 + t_leave * dx, y1 + t_leave * dy))
+
+    def clip_many(self, segments, diagnostics=False):
+        """Отсечение массива отрезков (N, 2, 2), как cyrus_beck_clip_batch"""
+        return cyrus_beck_clip_batch(self.polygon, segments, edges=self.edges, diagnostics=diagnostics)
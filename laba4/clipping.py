@@ -0,0 +1,383 @@
+"""Ядра алгоритмов отсечения без визуализации.
+
+Модуль зависит только от numpy, поэтому его можно импортировать из пакетных
+задач, не загружая matplotlib. Скрипты лабораторной берут функции отсюда.
+"""
+import numpy as np
+
+
+# Алгоритм Сазерленда-Коэна
+def compute_code(x, y, x_min, y_min, x_max, y_max):
+    """Вычисление регионного кода для точки (x, y)"""
+    # Каждый бит кода указывает положение точки относительно одной из границ
+    code = 0b0000
+    if x < x_min:
+        code |= 0b0001  # Лево
+    elif x > x_max:
+        code |= 0b0010  # Право
+    if y < y_min:
+        code |= 0b0100  # Низ
+    elif y > y_max:
+        code |= 0b1000  # Верх
+    # Если точка внутри прямоугольника, код будет 0000
+    return code
+
+
+def sutherland_cohen_clip(rect, p1, p2):
+    """Алгоритм отсечения Сазерленда-Коэна"""
+    x_min, y_min, x_max, y_max = rect
+    x1, y1 = p1
+    x2, y2 = p2
+
+    code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
+    code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
+    accept = False
+    intersection_points = []  # Все точки пересечения
+
+    while True:
+        # Если оба кода 0000 - отрезок полностью видимый
+        if code1 == 0 and code2 == 0:
+            accept = True
+            break
+        # Если побитовое И кодов не равно 0 - отрезок полностью невидимый
+        elif code1 & code2 != 0:
+            break
+        else:
+            # Выбираем точку вне прямоугольника
+            code_out = code1 if code1 != 0 else code2
+            x, y = 0, 0
+
+            # Находим точку пересечения
+            if code_out & 0b1000:  # Верх
+                x = x1 + (x2 - x1) * (y_max - y1) / (y2 - y1)
+                y = y_max
+            elif code_out & 0b0100:  # Низ
+                x = x1 + (x2 - x1) * (y_min - y1) / (y2 - y1)
+                y = y_min
+            elif code_out & 0b0010:  # Право
+                y = y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)
+                x = x_max
+            elif code_out & 0b0001:  # Лево
+                y = y1 + (y2 - y1) * (x_min - x1) / (x2 - x1)
+                x = x_min
+
+            # Сохраняем точку пересечения
+            intersection_points.append((x, y))
+
+            # Заменяем точку вне прямоугольника на точку пересечения
+            if code_out == code1:
+                x1, y1 = x, y
+                code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
+            else:
+                x2, y2 = x, y
+                code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
+
+    if accept:
+        return ((x1, y1), (x2, y2)), intersection_points
+    else:
+        return None, intersection_points
+
+
+def compute_codes(x, y, x_min, y_min, x_max, y_max):
+    """Регионные коды для массивов координат (как compute_code, но сразу для всех точек)"""
+    x = np.asarray(x)
+    y = np.asarray(y)
+    code = np.where(x < x_min, 0b0001, np.where(x > x_max, 0b0010, 0b0000))
+    code |= np.where(y < y_min, 0b0100, np.where(y > y_max, 0b1000, 0b0000))
+    return code
+
+
+def clip_segments(rect, segments):
+    """Отсечение Сазерленда-Коэна сразу для массива отрезков.
+
+    segments: массив (N, 2, 2) (или (N, 4)) концов отрезков.
+    Возвращает (clipped, accepted): clipped - массив (N, 2, 2) видимых частей
+    (NaN для невидимых отрезков), accepted - булева маска видимых отрезков.
+    Коды всех концов считаются разом; полностью видимые и полностью невидимые
+    отрезки отбрасываются сразу, цикл идёт только по оставшимся.
+    Результат совпадает с sutherland_cohen_clip для каждого отрезка.
+    """
+    x_min, y_min, x_max, y_max = rect
+    clipped = np.array(segments, dtype=np.float64).reshape(-1, 2, 2)
+    code1 = compute_codes(clipped[:, 0, 0], clipped[:, 0, 1], x_min, y_min, x_max, y_max)
+    code2 = compute_codes(clipped[:, 1, 0], clipped[:, 1, 1], x_min, y_min, x_max, y_max)
+
+    accepted = (code1 | code2) == 0
+    active = np.flatnonzero(~accepted & ((code1 & code2) == 0))
+
+    while active.size:
+        c1, c2 = code1[active], code2[active]
+        first = c1 != 0
+        code_out = np.where(first, c1, c2)
+        (x1, y1), (x2, y2) = clipped[active, 0].T, clipped[active, 1].T
+
+        # Точка пересечения с той границей, которую пересекает внешний конец
+        top = (code_out & 0b1000) != 0
+        bottom = ~top & ((code_out & 0b0100) != 0)
+        right = ~top & ~bottom & ((code_out & 0b0010) != 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = np.select([top, bottom, right],
+                          [x1 + (x2 - x1) * (y_max - y1) / (y2 - y1),
+                           x1 + (x2 - x1) * (y_min - y1) / (y2 - y1),
+                           x_max], x_min)
+            y = np.select([top, bottom, right],
+                          [y_max, y_min,
+                           y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)],
+                          y1 + (y2 - y1) * (x_min - x1) / (x2 - x1))
+        code = compute_codes(x, y, x_min, y_min, x_max, y_max)
+
+        # Заменяем внешний конец точкой пересечения
+        end = np.where(first, 0, 1)
+        clipped[active, end, 0] = x
+        clipped[active, end, 1] = y
+        code1[active[first]] = code[first]
+        code2[active[~first]] = code[~first]
+
+        c1, c2 = code1[active], code2[active]
+        inside = (c1 | c2) == 0
+        accepted[active[inside]] = True
+        active = active[~inside & ((c1 & c2) == 0)]
+
+    clipped[~accepted] = np.nan
+    return clipped, accepted
+
+
+# Алгоритм Цируса-Бека
+def dot(v1, v2):
+    return np.dot(v1, v2)
+
+
+def cyrus_beck_clip(polygon, p1, p2):
+    n = len(polygon)
+    d = np.array(p2) - np.array(p1)  # направляющий вектор отрезка
+    tE, tL = 0, 1  # начальные параметры входа и выхода
+    entry_points, exit_points = [], []  # списки точек пересечения
+
+    for i in range(n):
+        edge_start = np.array(polygon[i])
+        edge_end = np.array(polygon[(i + 1) % n])
+        edge = edge_end - edge_start  # вектор стороны многоугольника
+        normal = np.array([-edge[1], edge[0]])  # Нормаль к стороне
+
+        w = np.array(p1) - edge_start  # вектор от начала стороны к началу отрезка
+
+        # Скалярные произведения выписаны явно, как в cyrus_beck_clip_batch:
+        # np.dot может округлять иначе, и результаты разошлись бы в последнем бите
+        num = normal[0] * w[0] + normal[1] * w[1]  # числитель для вычисления t
+        den = normal[0] * d[0] + normal[1] * d[1]  # знаменатель
+
+        # Проверка параллельности
+        if den == 0:
+            if num < 0:  # Отрезок полностью вне
+                return None, (p1, p2), entry_points, exit_points
+            else:
+                continue  # Параллелен и внутри/на границе
+
+        t = -num / den  # параметр пересечения
+
+        # Все точки пересечения добавляются в списки
+        intersection_point = p1 + t * d
+        if den > 0:  # Входная точка
+            tE = max(tE, t)
+            entry_points.append(intersection_point)
+        else:  # Выходная точка
+            tL = min(tL, t)
+            exit_points.append(intersection_point)
+
+    if tE > tL:  # Нет видимой части
+        return None, (p1, p2), entry_points, exit_points
+
+    # Вычисляем конечные точки видимого отрезка
+    clipped_segment = (p1 + tE * d, p1 + tL * d)
+    return clipped_segment, (p1, p2), entry_points, exit_points
+
+
+def polygon_edges(polygon):
+    """Начала сторон и нормали к ним для выпуклого многоугольника (считаются один раз)"""
+    vertices = np.asarray(polygon, dtype=np.float64)
+    edges = np.roll(vertices, -1, axis=0) - vertices
+    normals = np.stack([-edges[:, 1], edges[:, 0]], axis=1)
+    return vertices, normals
+
+
+def cyrus_beck_clip_batch(polygon, segments, edges=None, diagnostics=False, chunk_size=1 << 12):
+    """Отсечение Цируса-Бека для массива отрезков (N, 2, 2) выпуклым многоугольником.
+
+    Нормали сторон считаются один раз (или передаются готовыми в edges,
+    см. polygon_edges), а параметры входа/выхода tE, tL - сразу для всех
+    отрезков и всех сторон. Возвращает (clipped, accepted): видимые части
+    (NaN для невидимых отрезков) и маску видимых. При diagnostics=True
+    дополнительно возвращает точки входа и выхода - массивы (N, M, 2),
+    NaN там, где сторона не даёт точки данного типа.
+    """
+    starts, normals = polygon_edges(polygon) if edges is None else edges
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2, 2)
+    n = len(segments)
+    clipped = np.full((n, 2, 2), np.nan)
+    accepted = np.zeros(n, dtype=bool)
+    if diagnostics:
+        entry_points = np.full((n, len(starts), 2), np.nan)
+        exit_points = np.full((n, len(starts), 2), np.nan)
+
+    for lo in range(0, n, chunk_size):
+        hi = min(lo + chunk_size, n)
+        p1 = segments[lo:hi, 0]
+        d = segments[lo:hi, 1] - p1
+
+        # (отрезки, стороны): числитель и знаменатель для параметра t
+        num = normals[:, 0] * (p1[:, 0, None] - starts[:, 0]) + normals[:, 1] * (p1[:, 1, None] - starts[:, 1])
+        den = normals[:, 0] * d[:, 0, None] + normals[:, 1] * d[:, 1, None]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = -num / den
+        entering = den > 0
+        leaving = den < 0
+
+        t_enter = np.max(t, axis=1, where=entering, initial=0)
+        t_leave = np.min(t, axis=1, where=leaving, initial=1)
+        visible = t_enter <= t_leave
+        parallel = ~(entering | leaving)
+        if parallel.any():
+            visible &= ~(parallel & (num < 0)).any(axis=1)
+
+        accepted[lo:hi] = visible
+        clipped[lo:hi, 0][visible] = p1[visible] + t_enter[visible, None] * d[visible]
+        clipped[lo:hi, 1][visible] = p1[visible] + t_leave[visible, None] * d[visible]
+
+        if diagnostics:
+            with np.errstate(invalid='ignore'):
+                points = p1[:, None, :] + t[:, :, None] * d[:, None, :]
+            entry_points[lo:hi][entering] = points[entering]
+            exit_points[lo:hi][leaving] = points[leaving]
+
+    if diagnostics:
+        return clipped, accepted, entry_points, exit_points
+    return clipped, accepted
+
+
+# Алгоритм средней точки
+def midpoint_clip(rect, p1, p2, eps=1e-5):
+    """Алгоритм средней точки для отсечения отрезка"""
+    x_min, y_min, x_max, y_max = rect
+    x1, y1 = p1
+    x2, y2 = p2
+
+    code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
+    code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
+    intersection_points = []
+    visible_segments = []
+
+    def is_close(a, b):
+        return abs(a - b) < eps
+
+    stack = [(x1, y1, x2, y2)]
+    while stack:
+        x1, y1, x2, y2 = stack.pop()
+        code1, code2 = (compute_code(x1, y1, x_min, y_min, x_max, y_max),
+                        compute_code(x2, y2, x_min, y_min, x_max, y_max))
+
+        if code1 == 0 and code2 == 0:
+            visible_segments.append(((x1, y1), (x2, y2)))
+            continue
+
+        if code1 & code2 != 0:
+            continue
+
+        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
+        intersection_points.append((mx, my))
+
+        if is_close(x1, x2) and is_close(y1, y2):
+            continue
+
+        stack.append((mx, my, x2, y2))
+        stack.append((x1, y1, mx, my))
+
+    return visible_segments, intersection_points
+
+
+def _line_points(p1, d, length, k):
+    """Точки цифрового отрезка: p1 + d * k / length с округлением до целых.
+
+    d = q * length + r, поэтому округление - q * k + (2 * r * k + length) // (2 * length):
+    |q| <= 1, а 2 * r * k < 2 * length^2 помещается в int64 при length < 2^31.
+    Более длинные отрезки считаются в целых Python.
+    """
+    length = np.maximum(length, 1)[:, None]
+    k = k[:, None]
+    q, r = np.divmod(d, length)
+    offset = q * k + (2 * r * k + length) // (2 * length)
+    big = np.flatnonzero(length[:, 0] >= 2 ** 31)
+    if big.size:
+        r, k, length = r[big].astype(object), k[big].astype(object), length[big].astype(object)
+        offset[big] = (q[big] * k + (2 * r * k + length) // (2 * length)).astype(np.int64)
+    return p1 + offset
+
+
+def _farthest_visible(rect, p1, d, length, backward, max_depth, trace):
+    """Самая дальняя видимая точка цифрового отрезка (деление пополам по номеру точки).
+
+    Точки отрезка нумеруются k = 0..length от p1; поиск идёт от начала к концу
+    отрезка (при backward - от конца к началу). Если часть от середины до
+    дальнего края тривиально невидима, ответ лежит ближе середины, иначе дальше:
+    за границей, через которую отрезок вышел из окна, остаётся вся его
+    дальнейшая часть, так что общий бит кода у середины и края есть всегда.
+    Возвращает (номер точки, найдено).
+    """
+    def codes(k, idx=slice(None)):
+        q = _line_points(p1[idx], d[idx], length[idx], length[idx] - k if backward else k)
+        return compute_codes(q[:, 0], q[:, 1], *rect), q
+
+    near = np.zeros_like(length)
+    far = length.copy()
+    code_near, _ = codes(near)
+    code_far, _ = codes(far)
+    active = np.flatnonzero((code_far != 0) & ((code_near & code_far) == 0) & (far > 1))
+
+    for depth in range(max_depth):
+        if not active.size:
+            break
+        mid = (near[active] + far[active]) >> 1
+        code_mid, q = codes(mid, active)
+        if trace is not None:
+            trace[active, depth] = q
+        rejected = (code_mid & code_far[active]) != 0
+        far[active[rejected]] = mid[rejected]
+        code_far[active[rejected]] = code_mid[rejected]
+        near[active[~rejected]] = mid[~rejected]
+        code_near[active[~rejected]] = code_mid[~rejected]
+        active = active[(code_far[active] != 0) & (far[active] - near[active] > 1)]
+
+    k = np.where(code_far == 0, far, near)
+    return (length - k if backward else k), (code_far == 0) | (code_near == 0)
+
+
+def midpoint_clip_batch(rect, segments, max_depth=32, diagnostics=False):
+    """Отсечение средней точкой для массива отрезков в целых (пиксельных) координатах.
+
+    Отрезок рассматривается как цифровой: length + 1 точек p1 + d * k / length,
+    округлённых до целых, где length = max(|dx|, |dy|). Концы видимой части -
+    самые дальние видимые точки от p1 и от p2 - ищутся делением пополам по k,
+    не более max_depth шагов (32 шага хватает для любых координат int32).
+    Видимая часть получается сразу одним отрезком, без дробления на куски.
+    Возвращает (clipped, accepted): массив (N, 2, 2) int64 и маску видимых
+    отрезков (у невидимых clipped совпадает с исходным отрезком). При
+    diagnostics=True третьим элементом идут точки деления: массив
+    (N, 2, max_depth, 2) с NaN там, где шагов было меньше.
+    """
+    segments = np.rint(np.asarray(segments, dtype=np.float64)).astype(np.int64).reshape(-1, 2, 2)
+    p1 = segments[:, 0]
+    d = segments[:, 1] - p1
+    length = np.abs(d).max(axis=1)
+    trace = np.full((len(segments), 2, max_depth, 2), np.nan) if diagnostics else None
+
+    k_end, found_end = _farthest_visible(rect, p1, d, length, False, max_depth,
+                                         trace[:, 0] if diagnostics else None)
+    k_start, found_start = _farthest_visible(rect, p1, d, length, True, max_depth,
+                                             trace[:, 1] if diagnostics else None)
+
+    accepted = found_start & found_end
+    clipped = segments.copy()
+    clipped[accepted, 0] = _line_points(p1, d, length, k_start)[accepted]
+    clipped[accepted, 1] = _line_points(p1, d, length, k_end)[accepted]
+    if diagnostics:
+        return clipped, accepted, trace
+    return clipped, accepted
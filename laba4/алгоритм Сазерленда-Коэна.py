@@ -1,8 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from clipping import compute_code, sutherland_cohen_clip, compute_codes, clip_segments
 
 
 def on_scroll(event):
+    import matplotlib.pyplot as plt
+
     ax = plt.gca()
     current_xlim = ax.get_xlim()
     current_ylim = ax.get_ylim()
@@ -18,79 +21,10 @@ def on_scroll(event):
     plt.draw()
 
 
-def compute_code(x, y, x_min, y_min, x_max, y_max):
-    """Вычисление регионного кода для точки (x, y)"""
-    # Каждый бит кода указывает положение точки относительно одной из границ
-    code = 0b0000
-    if x < x_min:
-        code |= 0b0001  # Лево
-    elif x > x_max:
-        code |= 0b0010  # Право
-    if y < y_min:
-        code |= 0b0100  # Низ
-    elif y > y_max:
-        code |= 0b1000  # Верх
-    # Если точка внутри прямоугольника, код будет 0000
-    return code
-
-
-def sutherland_cohen_clip(rect, p1, p2):
-    """Алгоритм отсечения Сазерленда-Коэна"""
-    x_min, y_min, x_max, y_max = rect
-    x1, y1 = p1
-    x2, y2 = p2
-
-    code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
-    code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
-    accept = False
-    intersection_points = []  # Все точки пересечения
-
-    while True:
-        # Если оба кода 0000 - отрезок полностью видимый
-        if code1 == 0 and code2 == 0:
-            accept = True
-            break
-        # Если побитовое И кодов не равно 0 - отрезок полностью невидимый
-        elif code1 & code2 != 0:
-            break
-        else:
-            # Выбираем точку вне прямоугольника
-            code_out = code1 if code1 != 0 else code2
-            x, y = 0, 0
-
-            # Находим точку пересечения
-            if code_out & 0b1000:  # Верх
-                x = x1 + (x2 - x1) * (y_max - y1) / (y2 - y1)
-                y = y_max
-            elif code_out & 0b0100:  # Низ
-                x = x1 + (x2 - x1) * (y_min - y1) / (y2 - y1)
-                y = y_min
-            elif code_out & 0b0010:  # Право
-                y = y1 + (y2 - y1) * (x_max - x1) / (x2 - x1)
-                x = x_max
-            elif code_out & 0b0001:  # Лево
-                y = y1 + (y2 - y1) * (x_min - x1) / (x2 - x1)
-                x = x_min
-
-            # Сохраняем точку пересечения
-            intersection_points.append((x, y))
-
-            # Заменяем точку вне прямоугольника на точку пересечения
-            if code_out == code1:
-                x1, y1 = x, y
-                code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
-            else:
-                x2, y2 = x, y
-                code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
-
-    if accept:
-        return ((x1, y1), (x2, y2)), intersection_points
-    else:
-        return None, intersection_points
-
-
 def plot_clipping(rect, original_segment, clipped_segment, intersection_points):
     """Визуализация отсечения"""
+    import matplotlib.pyplot as plt
+
     x_min, y_min, x_max, y_max = rect
     fig, ax = plt.subplots(figsize=(10, 8))
 
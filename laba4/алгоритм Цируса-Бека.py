@@ -1,8 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from clipping import dot, cyrus_beck_clip, polygon_edges, cyrus_beck_clip_batch
 
 
 def on_scroll(event):
+    import matplotlib.pyplot as plt
+
     ax = plt.gca()
     current_xlim = ax.get_xlim()
     current_ylim = ax.get_ylim()
@@ -18,54 +21,9 @@ def on_scroll(event):
     plt.draw()
 
 
-def dot(v1, v2):
-    return np.dot(v1, v2)
-
-
-def cyrus_beck_clip(polygon, p1, p2):
-    n = len(polygon)
-    d = np.array(p2) - np.array(p1)  # направляющий вектор отрезка
-    tE, tL = 0, 1  # начальные параметры входа и выхода
-    entry_points, exit_points = [], []  # списки точек пересечения
-
-    for i in range(n):
-        edge_start = np.array(polygon[i])
-        edge_end = np.array(polygon[(i + 1) % n])
-        edge = edge_end - edge_start  # вектор стороны многоугольника
-        normal = np.array([-edge[1], edge[0]])  # Нормаль к стороне
-
-        w = np.array(p1) - edge_start  # вектор от начала стороны к началу отрезка
-
-        num = np.dot(normal, w)  # числитель для вычисления t
-        den = np.dot(normal, d)  # знаменатель
-
-        # Проверка параллельности
-        if den == 0:
-            if num < 0:  # Отрезок полностью вне
-                return None, (p1, p2), entry_points, exit_points
-            else:
-                continue  # Параллелен и внутри/на границе
-
-        t = -num / den  # параметр пересечения
-
-        # Все точки пересечения добавляются в списки
-        intersection_point = p1 + t * d
-        if den > 0:  # Входная точка
-            tE = max(tE, t)
-            entry_points.append(intersection_point)
-        else:  # Выходная точка
-            tL = min(tL, t)
-            exit_points.append(intersection_point)
-
-    if tE > tL:  # Нет видимой части
-        return None, (p1, p2), entry_points, exit_points
-
-    # Вычисляем конечные точки видимого отрезка
-    clipped_segment = (p1 + tE * d, p1 + tL * d)
-    return clipped_segment, (p1, p2), entry_points, exit_points
-
-
 def plot_clipping(polygon, original_segment, clipped_segment, entry_points, exit_points):
+    import matplotlib.pyplot as plt
+
     polygon = np.array(polygon)
     fig, ax = plt.subplots(figsize=(10, 8))
     ax.plot(*polygon.T, 'b-', label='Polygon')
@@ -95,7 +53,8 @@ def plot_clipping(polygon, original_segment, clipped_segment, entry_points, exit
 
 
 # Пример использования
-polygon = [(1, 1), (5, 1), (6, 3), (5, 5), (2, 5), (1, 3)]
-p1, p2 = (0, 0), (9, 6)
-clipped, original, entries, exits = cyrus_beck_clip(polygon, p1, p2)
-plot_clipping(polygon, original, clipped, entries, exits)
+if __name__ == "__main__":
+    polygon = [(1, 1), (5, 1), (6, 3), (5, 5), (2, 5), (1, 3)]
+    p1, p2 = (0, 0), (9, 6)
+    clipped, original, entries, exits = cyrus_beck_clip(polygon, p1, p2)
+    plot_clipping(polygon, original, clipped, entries, exits)
@@ -1,9 +1,12 @@
 import numpy as np
-import matplotlib.pyplot as plt
+
+from clipping import compute_code, compute_codes, midpoint_clip, midpoint_clip_batch
 
 
 def on_scroll(event):
     """Обработчик масштабирования колесом мыши"""
+    import matplotlib.pyplot as plt
+
     ax = plt.gca()
     zoom_factor = 1.1
     if event.button == 'up':
@@ -15,57 +18,10 @@ def on_scroll(event):
     plt.draw()
 
 
-def compute_code(x, y, x_min, y_min, x_max, y_max):
-    """Вычисление регионного кода точки"""
-    code = 0b0000
-    if x < x_min: code |= 0b0001  # Лево
-    if x > x_max: code |= 0b0010  # Право
-    if y < y_min: code |= 0b0100  # Низ
-    if y > y_max: code |= 0b1000  # Верх
-    return code
-
-
-def midpoint_clip(rect, p1, p2, eps=1e-5):
-    """Алгоритм средней точки для отсечения отрезка"""
-    x_min, y_min, x_max, y_max = rect
-    x1, y1 = p1
-    x2, y2 = p2
-
-    code1 = compute_code(x1, y1, x_min, y_min, x_max, y_max)
-    code2 = compute_code(x2, y2, x_min, y_min, x_max, y_max)
-    intersection_points = []
-    visible_segments = []
-
-    def is_close(a, b):
-        return abs(a - b) < eps
-
-    stack = [(x1, y1, x2, y2)]
-    while stack:
-        x1, y1, x2, y2 = stack.pop()
-        code1, code2 = (compute_code(x1, y1, x_min, y_min, x_max, y_max),
-                        compute_code(x2, y2, x_min, y_min, x_max, y_max))
-
-        if code1 == 0 and code2 == 0:
-            visible_segments.append(((x1, y1), (x2, y2)))
-            continue
-
-        if code1 & code2 != 0:
-            continue
-
-        mx, my = (x1 + x2) / 2, (y1 + y2) / 2
-        intersection_points.append((mx, my))
-
-        if is_close(x1, x2) and is_close(y1, y2):
-            continue
-
-        stack.append((mx, my, x2, y2))
-        stack.append((x1, y1, mx, my))
-
-    return visible_segments, intersection_points
-
-
 def plot_results(rect, original_segment, visible_segments, intersection_points):
     """Визуализация результатов отсечения"""
+    import matplotlib.pyplot as plt
+
     x_min, y_min, x_max, y_max = rect
     fig, ax = plt.subplots(figsize=(10, 8))
 
@@ -0,0 +1,120 @@
+import os
+import time
+
+import numpy as np
+
+from fill import edge_index, points_in_polygon, polygon_mask, scanline_fill, seed_fill_spans, tiled_seed_fill
+from main import seed_fill_by_lines
+
+POLYGON = [(0, 0), (400, 10), (200, 60), (150, 200), (200, 350), (125, 200), (125, 350), (100, 200),
+           (75, 200), (50, 350), (50, 200), (-5, 100)]
+SEED = (60, 220)
+
+
+def scaled(polygon, point, factor):
+    """Многоугольник и точка, увеличенные в factor раз"""
+    return [(x * factor, y * factor) for x, y in polygon], (point[0] * factor, point[1] * factor)
+
+
+def best_time(run, repeat=3):
+    """Лучшее время из repeat запусков и результат последнего"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def seed_fill_all(polygon, seed):
+    """Все пиксели заливки с затравкой одним массивом (N, 2)"""
+    spans = list(seed_fill_by_lines(polygon, seed))
+    return np.concatenate(spans) if spans else np.empty((0, 2), dtype=np.int64)
+
+
+def check_fills(polygon, seed):
+    """Проверяет согласованность заливок.
+
+    Построчная чётно-нечётная заливка совпадает с polygon_mask, ненулевая
+    её покрывает, а заливка с затравкой лежит внутри чётно-нечётной маски.
+    """
+    reference, min_x, min_y = polygon_mask(polygon)
+    evenodd, _, _ = scanline_fill(polygon)
+    nonzero, _, _ = scanline_fill(polygon, "nonzero")
+    if not np.array_equal(evenodd, reference):
+        raise AssertionError("scanline_fill (evenodd) не совпадает с polygon_mask")
+    if (evenodd & ~nonzero).any():
+        raise AssertionError("scanline_fill (nonzero) не покрывает evenodd")
+    pixels = seed_fill_all(polygon, seed)
+    if not reference[pixels[:, 1] - min_y, pixels[:, 0] - min_x].all():
+        raise AssertionError("seed_fill_by_lines вышла за пределы маски")
+
+
+def benchmark(factors=(1, 4, 16)):
+    """Время заполнения многоугольника из laba5/main.py при разных масштабах.
+
+    Заливка с затравкой закрашивает только связную область вокруг точки,
+    построчная заливка - весь многоугольник.
+    """
+    print(f"{'масштаб':>8} {'evenodd, с':>11} {'nonzero, с':>11} {'маска, с':>10} {'затравка, с':>12} "
+          f"{'пикс. evenodd':>14} {'пикс. затравка':>15}")
+    for factor in factors:
+        polygon, seed = scaled(POLYGON, SEED, factor)
+        check_fills(polygon, seed)
+        evenodd, (mask, _, _) = best_time(lambda: scanline_fill(polygon))
+        nonzero, _ = best_time(lambda: scanline_fill(polygon, "nonzero"))
+        reference, _ = best_time(lambda: polygon_mask(polygon))
+        seeded, pixels = best_time(lambda: seed_fill_all(polygon, seed))
+        print(f"{factor:>8} {evenodd:>11.4f} {nonzero:>11.4f} {reference:>10.4f} {seeded:>12.4f} "
+              f"{int(mask.sum()):>14} {len(pixels):>15}")
+
+
+def random_polygon(n, seed=0):
+    """Звёздный многоугольник из n вершин вокруг начала координат"""
+    rng = np.random.default_rng(seed)
+    angles = np.sort(rng.uniform(0, 2 * np.pi, n))
+    radii = rng.uniform(500, 1000, n)
+    return np.column_stack((radii * np.cos(angles), radii * np.sin(angles)))
+
+
+def benchmark_points(vertices=(10, 100, 500), n=10 ** 5):
+    """Время points_in_polygon без индекса и с индексом полос (построение отдельно)"""
+    points = np.random.default_rng(1).uniform(-1000, 1000, (n, 2))
+    print(f"\n{'вершин':>8} {'перебор, с':>11} {'индекс, с':>10} {'запрос, с':>10} {'внутри':>8}")
+    for count in vertices:
+        polygon = random_polygon(count)
+        brute, inside = best_time(lambda: points_in_polygon(polygon, points))
+        build, index = best_time(lambda: edge_index(polygon))
+        query, indexed = best_time(lambda: points_in_polygon(polygon, points, index=index))
+        if not np.array_equal(inside, indexed):
+            raise AssertionError("points_in_polygon с индексом и без него расходятся")
+        print(f"{count:>8} {brute:>11.4f} {build:>10.4f} {query:>10.4f} {int(inside.sum()):>8}")
+
+
+def seed_fill_mask(polygon, seed):
+    """Маска области затравки через polygon_mask и seed_fill_spans в одном процессе"""
+    mask, min_x, min_y = polygon_mask(polygon)
+    filled = np.zeros_like(mask)
+    for y, left, right in seed_fill_spans(mask, seed, origin=(min_x, min_y)):
+        filled[y - min_y, left - min_x:right - min_x + 1] = True
+    return filled
+
+
+def benchmark_tiled(factor=16, workers=(1, 2, 4, 8), band_height=512):
+    """Время tiled_seed_fill при разном числе процессов против заливки в одном процессе"""
+    polygon, seed = scaled(POLYGON, SEED, factor)
+    single, reference = best_time(lambda: seed_fill_mask(polygon, seed), repeat=1)
+    print(f"\nмасштаб {factor}, {reference.shape[1]}x{reference.shape[0]}, ядер {os.cpu_count()}")
+    print(f"{'процессов':>10} {'время, с':>9} {'ускорение':>10}")
+    print(f"{'-':>10} {single:>9.3f} {1:>9.2f}x")
+    for count in workers:
+        elapsed, (mask, _, _) = best_time(lambda: tiled_seed_fill(polygon, seed, band_height, count), repeat=1)
+        if not np.array_equal(mask, reference):
+            raise AssertionError("tiled_seed_fill не совпадает с seed_fill_spans")
+        print(f"{count:>10} {elapsed:>9.3f} {single / elapsed:>9.2f}x")
+
+
+if __name__ == "__main__":
+    benchmark()
+    benchmark_points()
+    benchmark_tiled()
@@ -0,0 +1,424 @@
+"""Заполнение многоугольника по маске без визуализации (зависит только от numpy)."""
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+
+def polygon_bounds(polygon):
+    """Ограничивающий прямоугольник многоугольника: (min_x, max_x, min_y, max_y)"""
+    xs = [p[0] for p in polygon]
+    ys = [p[1] for p in polygon]
+    return min(xs), max(xs), min(ys), max(ys)
+
+
+def polygon_mask(polygon):
+    """Маска внутренних пикселей многоугольника в его ограничивающем прямоугольнике.
+
+    Пиксель (x, y) внутри, если луч из него вправо пересекает стороны нечётное
+    число раз - тот же тест, что и point_in_polygon, с теми же вычислениями
+    точки пересечения, поэтому маска совпадает с попиксельной проверкой.
+    Возвращает (mask, min_x, min_y), mask[y - min_y, x - min_x].
+    """
+    min_x, max_x, min_y, max_y = polygon_bounds(polygon)
+    return mask_rows(polygon, min_x, max_x - min_x + 1, min_y, max_y + 1), min_x, min_y
+
+
+def mask_rows(polygon, min_x, width, y_start, y_stop):
+    """Строки y_start <= y < y_stop маски polygon_mask шириной width, начиная с x = min_x"""
+    height = y_stop - y_start
+    vertices = np.asarray(polygon, dtype=np.int64)
+    x1, y1 = vertices[:, 0], vertices[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+
+    # Пересечения каждой строки со сторонами: матрица (строки, стороны)
+    y = np.arange(y_start, y_stop)[:, None]
+    crosses = (y1 > y) != (y2 > y)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x_cross = (x2 - x1) * (y - y1) / (y2 - y1) + x1
+
+    # Пересечение c учитывается пикселями x < c, то есть x < ceil(c):
+    # считаем их разностным массивом и берём чётность (переполнение int8 её не меняет)
+    rows, edges = np.nonzero(crosses)
+    limit = np.clip(np.ceil(x_cross[rows, edges]) - min_x, 0, width).astype(np.int64)
+    counts = np.zeros((height, width + 1), dtype=np.int8)
+    np.add.at(counts, (rows, 0), 1)
+    np.add.at(counts, (rows, limit), -1)
+    return (np.cumsum(counts[:, :width], axis=1, dtype=np.int8) & 1).astype(bool)
+
+
+def mask_runs(mask):
+    """Горизонтальные отрезки из True в маске: (row, start, end, offsets).
+
+    Отрезки отсортированы по строкам, отрезки строки y - с offsets[y]
+    по offsets[y + 1].
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    change = np.diff(padded, axis=1)
+    row, start = np.nonzero(change == 1)
+    _, end = np.nonzero(change == -1)
+    offsets = np.zeros(height + 1, dtype=np.int64)
+    np.cumsum(np.bincount(row, minlength=height), out=offsets[1:])
+    return row, start, end - 1, offsets
+
+
+def seed_fill_spans(mask, seed, origin=(0, 0)):
+    """Заполнение с затравкой по отрезкам на готовой маске.
+
+    Каждая горизонтальная серия внутренних пикселей маски закрашивается целиком
+    и один раз; в стек соседних строк кладётся одна затравка на серию, которая
+    касается текущей. Генератор выдаёт закрашенные отрезки (y, x_левый, x_правый)
+    в координатах со смещением origin = (min_x, min_y).
+    """
+    min_x, min_y = origin
+    height, width = mask.shape
+    x, y = seed[0] - min_x, seed[1] - min_y
+    if not (0 <= x < width and 0 <= y < height) or not mask[y, x]:
+        return
+
+    row, start, end, offsets = mask_runs(mask)
+    filled = np.zeros(len(row), dtype=bool)
+
+    first = offsets[y] + np.searchsorted(start[offsets[y]:offsets[y + 1]], x, side='right') - 1
+    stack = [int(first)]
+    filled[first] = True
+    while stack:
+        run = stack.pop()
+        y, left, right = int(row[run]), int(start[run]), int(end[run])
+        yield y + min_y, left + min_x, right + min_x
+
+        for ny in (y + 1, y - 1):
+            if not 0 <= ny < height:
+                continue
+            lo, hi = offsets[ny], offsets[ny + 1]
+            # Серии соседней строки, пересекающиеся с [left, right] по x
+            a = lo + np.searchsorted(end[lo:hi], left, side='left')
+            b = lo + np.searchsorted(start[lo:hi], right, side='right')
+            for other in range(a, b):
+                if not filled[other]:
+                    filled[other] = True
+                    stack.append(other)
+
+
+def edge_table(polygon):
+    """Таблица рёбер: для каждой стороны (y_начала, y_конца, x1, y1, x2, y2, направление).
+
+    Сторона пересекает строки y_начала <= y < y_конца (горизонтальные стороны
+    не пересекает ни одну). Направление +1, если сторона идёт вверх, иначе -1.
+    Строки таблицы отсортированы по y_начала.
+    """
+    vertices = np.asarray(polygon, dtype=np.int64)
+    x1, y1 = vertices[:, 0], vertices[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    keep = y1 != y2
+    table = np.stack([np.minimum(y1, y2), np.maximum(y1, y2), x1, y1, x2, y2,
+                      np.where(y2 > y1, 1, -1)], axis=1)[keep]
+    return table[np.argsort(table[:, 0], kind='stable')]
+
+
+def scanline_fill(polygon, rule="evenodd"):
+    """Построчное заполнение многоугольника с таблицей рёбер и списком активных рёбер.
+
+    rule - "evenodd" (чётно-нечётное правило, совпадает с polygon_mask) или
+    "nonzero" (ненулевое число оборотов). Самопересекающиеся многоугольники
+    допускаются. Отрезки каждой строки пишутся в маску срезами.
+    Возвращает (mask, min_x, min_y), как polygon_mask.
+    """
+    if rule not in ("evenodd", "nonzero"):
+        raise ValueError(f"Неизвестное правило заполнения: {rule}")
+    min_x, max_x, min_y, max_y = polygon_bounds(polygon)
+    width = max_x - min_x + 1
+    mask = np.zeros((max_y - min_y + 1, width), dtype=bool)
+
+    table = edge_table(polygon)
+    next_edge = 0
+    active = np.empty((0, table.shape[1]), dtype=np.int64)
+
+    for y in range(min_y, max_y + 1):
+        # Добавляем рёбра, начинающиеся на этой строке, и убираем закончившиеся
+        start = next_edge
+        while next_edge < len(table) and table[next_edge, 0] <= y:
+            next_edge += 1
+        active = np.concatenate([active[active[:, 1] > y], table[start:next_edge]])
+        if not len(active):
+            continue
+
+        _, _, x1, y1, x2, y2, direction = active.T
+        x_cross = (x2 - x1) * (y - y1) / (y2 - y1) + x1
+        # Пересечение c учитывается пикселями x < ceil(c)
+        limits = np.clip(np.ceil(x_cross) - min_x, 0, width).astype(np.int64)
+        order = np.argsort(limits, kind='stable')
+        limits = limits[order]
+        if rule == "evenodd":
+            # Между k-м и (k+1)-м пересечением пиксели видят справа n - k - 1 пересечений
+            inside = (len(limits) - 1 - np.arange(len(limits) - 1)) % 2 == 1
+        else:
+            # ... и сумму их направлений (число оборотов)
+            inside = np.cumsum(direction[order][::-1])[::-1][1:] != 0
+
+        row = mask[y - min_y]
+        for k in np.flatnonzero(inside):
+            row[limits[k]:limits[k + 1]] = True
+    return mask, min_x, min_y
+
+
+def _polygon_sides(polygon):
+    """Негоризонтальные стороны многоугольника массивом (M, 4): x1, y1, x2, y2"""
+    vertices = np.asarray(polygon, dtype=np.float64)
+    sides = np.hstack([vertices, np.roll(vertices, -1, axis=0)])
+    return sides[sides[:, 1] != sides[:, 3]]
+
+
+def edge_index(polygon):
+    """Индекс сторон по горизонтальным полосам для повторных points_in_polygon.
+
+    Границы полос - различные y вершин; внутри полосы набор пересекаемых
+    сторон не меняется, поэтому точке достаточно проверить стороны своей полосы.
+    Возвращает (levels, offsets, sides): стороны полосы levels[k] <= y < levels[k + 1]
+    лежат в sides[offsets[k]:offsets[k + 1]].
+    """
+    sides = _polygon_sides(polygon)
+    levels = np.unique(np.asarray(polygon, dtype=np.float64)[:, 1])
+    low = np.searchsorted(levels, np.minimum(sides[:, 1], sides[:, 3]))
+    high = np.searchsorted(levels, np.maximum(sides[:, 1], sides[:, 3]))
+
+    # Сторона попадает во все полосы с low по high - 1
+    counts = high - low
+    owner = np.repeat(np.arange(len(sides)), counts)
+    slab = np.repeat(low - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    order = np.argsort(slab, kind='stable')
+    offsets = np.zeros(len(levels), dtype=np.int64)
+    np.cumsum(np.bincount(slab, minlength=len(levels) - 1), out=offsets[1:])
+    return levels, offsets, sides[owner[order]]
+
+
+def _crossings(sides, x, y):
+    """Пересекает ли луч вправо из (x, y) сторону - тот же тест, что в point_in_polygon"""
+    x1, y1, x2, y2 = sides.T
+    return ((y1 > y) != (y2 > y)) & (x < (x2 - x1) * (y - y1) / (y2 - y1) + x1)
+
+
+def points_in_polygon(polygon, points, index=None, chunk_size=1 << 20):
+    """Пакетная проверка точек (N, 2) на попадание в многоугольник (чётно-нечётное правило).
+
+    Без индекса каждая точка сравнивается со всеми сторонами; пары
+    точка-сторона обрабатываются частями не больше chunk_size. С индексом
+    edge_index(polygon) точка проверяется только по сторонам своей полосы.
+    Возвращает булев массив длины N.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    x, y = points[:, 0], points[:, 1]
+    inside = np.zeros(len(points), dtype=bool)
+
+    if index is None:
+        sides = _polygon_sides(polygon)
+        if not len(sides):
+            return inside
+        edge_step = min(len(sides), chunk_size)
+        point_step = max(1, chunk_size // edge_step)
+        for start in range(0, len(points), point_step):
+            px, py = x[start:start + point_step, None], y[start:start + point_step, None]
+            for first in range(0, len(sides), edge_step):
+                crossed = _crossings(sides[first:first + edge_step], px, py)
+                inside[start:start + point_step] ^= (np.count_nonzero(crossed, axis=1) & 1).astype(bool)
+        return inside
+
+    levels, offsets, sides = index
+    slab = np.searchsorted(levels, y, side='right') - 1
+    # Точки выше и ниже всех вершин снаружи; остальные группируем по полосам
+    ids = np.flatnonzero((slab >= 0) & (slab < len(levels) - 1))
+    ids = ids[np.argsort(slab[ids], kind='stable')]
+    bounds = np.searchsorted(slab[ids], np.arange(len(levels)))
+    for k in range(len(levels) - 1):
+        group, band = ids[bounds[k]:bounds[k + 1]], sides[offsets[k]:offsets[k + 1]]
+        if not len(group) or not len(band):
+            continue
+        # Все стороны полосы пересекают её строки, остаётся сравнить x
+        x1, y1, x2, y2 = band.T
+        step = max(1, chunk_size // len(band))
+        for start in range(0, len(group), step):
+            part = group[start:start + step]
+            crossed = x[part, None] < (x2 - x1) * (y[part, None] - y1) / (y2 - y1) + x1
+            inside[part] = np.count_nonzero(crossed, axis=1) & 1
+    return inside
+
+
+def _overlap_pairs(row, start, end, width):
+    """Пары (i, j) серий соседних строк row[j] = row[i] + 1, пересекающихся по x.
+
+    Серии отсортированы по (row, start), как в mask_runs; связность та же,
+    что в seed_fill_spans.
+    """
+    key = row * (width + 1)
+    a = np.searchsorted(key + end, key + width + 1 + start, side='left')
+    b = np.searchsorted(key + start, key + width + 1 + end, side='right')
+    counts = b - a
+    i = np.repeat(np.arange(len(row)), counts)
+    j = np.repeat(a - np.cumsum(counts) + counts, counts) + np.arange(counts.sum())
+    return i, j
+
+
+def _components(n, i, j):
+    """Метки компонент связности графа из n вершин с рёбрами (i, j): наименьшая вершина компоненты"""
+    parent = np.arange(n)
+    while True:
+        root_i, root_j = parent[i], parent[j]
+        if np.array_equal(root_i, root_j):
+            return parent
+        # Подвешиваем больший корень к меньшему и сжимаем пути до корней
+        np.minimum.at(parent, np.maximum(root_i, root_j), np.minimum(root_i, root_j))
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
+
+
+def _fill_band(task):
+    """Растеризует полосу строк в общую маску и размечает её серии по связности"""
+    name, shape, polygon, min_x, min_y, y0, y1 = task
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        mask = np.ndarray(shape, dtype=bool, buffer=memory.buf)
+        band = mask[y0:y1]
+        band[:] = mask_rows(polygon, min_x, shape[1], min_y + y0, min_y + y1)
+        row, start, end, _ = mask_runs(band)
+        i, j = _overlap_pairs(row, start, end, shape[1])
+        _, labels = np.unique(_components(len(row), i, j), return_inverse=True)
+        del mask, band
+    finally:
+        memory.close()
+    return row + y0, start, end, labels.reshape(-1)
+
+
+def _clear_band(task):
+    """Стирает в общей маске серии полосы, не связанные с затравкой"""
+    name, shape, y0, y1, row, start, end = task
+    memory = shared_memory.SharedMemory(name=name)
+    try:
+        mask = np.ndarray(shape, dtype=bool, buffer=memory.buf)
+        counts = np.zeros((y1 - y0, shape[1] + 1), dtype=np.int8)
+        np.add.at(counts, (row - y0, start), 1)
+        np.add.at(counts, (row - y0, end + 1), -1)
+        mask[y0:y1] &= np.cumsum(counts[:, :-1], axis=1, dtype=np.int8) == 0
+        del mask
+    finally:
+        memory.close()
+
+
+def tiled_seed_fill(polygon, seed, band_height=512, workers=None, packed=False):
+    """Заполнение с затравкой по полосам в нескольких процессах.
+
+    Ограничивающий прямоугольник делится на полосы по band_height строк.
+    Процессы пула (workers, по умолчанию по числу ядер) растеризуют свои полосы
+    в общую маску (multiprocessing.shared_memory) и размечают серии по связности
+    внутри полосы. Основной процесс сшивает метки по границам полос, выбирает
+    компоненту затравки, после чего процессы стирают остальные серии.
+    Связность та же, что у seed_fill_spans. Возвращает (mask, min_x, min_y);
+    в маске только область затравки. С packed=True маска возвращается
+    упакованной (pack_mask) без промежуточной копии по байту на пиксель.
+    """
+    min_x, max_x, min_y, max_y = polygon_bounds(polygon)
+    shape = (max_y - min_y + 1, max_x - min_x + 1)
+    bands = [(y0, min(y0 + band_height, shape[0])) for y0 in range(0, shape[0], band_height)]
+    polygon = [tuple(p) for p in polygon]
+
+    memory = shared_memory.SharedMemory(create=True, size=max(1, shape[0] * shape[1]))
+    try:
+        with Pool(workers) as pool:
+            runs = pool.map(_fill_band, [(memory.name, shape, polygon, min_x, min_y, y0, y1)
+                                         for y0, y1 in bands])
+
+            # Метки полос сквозные, сшиваем их по парам серий на границах полос
+            shift = np.cumsum([0] + [labels.max() + 1 if len(labels) else 0 for *_, labels in runs])
+            row, start, end, labels = (np.concatenate(parts) for parts in zip(*runs))
+            labels = labels + np.repeat(shift[:-1], [len(r[0]) for r in runs])
+            border = np.flatnonzero(np.isin(row, [y0 for y0, _ in bands[1:]] + [y1 - 1 for _, y1 in bands[:-1]]))
+            i, j = _overlap_pairs(row[border], start[border], end[border], shape[1])
+            component = _components(shift[-1], labels[border[i]], labels[border[j]])[labels]
+
+            x, y = seed[0] - min_x, seed[1] - min_y
+            hit = np.flatnonzero((row == y) & (start <= x) & (end >= x))
+            keep = component == component[hit[0]] if len(hit) else np.zeros(len(row), dtype=bool)
+            drop = ~keep
+            pool.map(_clear_band, [(memory.name, shape, y0, y1, row[m], start[m], end[m])
+                                   for (y0, y1), m in ((b, drop & (row >= b[0]) & (row < b[1]))
+                                                       for b in bands)])
+
+        mask = np.ndarray(shape, dtype=bool, buffer=memory.buf)
+        mask = pack_mask(mask) if packed else mask.copy()
+    finally:
+        memory.close()
+        memory.unlink()
+    return mask, min_x, min_y
+
+
+def pack_mask(mask):
+    """Маска по биту на пиксель: строки упакованы np.packbits (ширина дополнена до байта)"""
+    return np.packbits(mask, axis=1)
+
+
+def unpack_mask(bits, width):
+    """Обратно к булевой маске шириной width"""
+    return np.unpackbits(bits, axis=1, count=width).astype(bool)
+
+
+def mask_spans(mask, origin=(0, 0)):
+    """Отрезки маски массивом int32 (K, 3): строка, x_начала, x_конца (включительно).
+
+    Координаты со смещением origin = (min_x, min_y), отрезки отсортированы
+    по строкам и x - в том же виде, что выдаёт seed_fill_spans.
+    """
+    row, start, end, _ = mask_runs(mask)
+    min_x, min_y = origin
+    return np.column_stack((row + min_y, start + min_x, end + min_x)).astype(np.int32)
+
+
+def spans_mask(spans, shape, origin=(0, 0)):
+    """Маска размера shape из отрезков (K, 3), как у mask_spans"""
+    min_x, min_y = origin
+    spans = np.asarray(spans, dtype=np.int64).reshape(-1, 3)
+    counts = np.zeros((shape[0], shape[1] + 1), dtype=np.int8)
+    np.add.at(counts, (spans[:, 0] - min_y, spans[:, 1] - min_x), 1)
+    np.add.at(counts, (spans[:, 0] - min_y, spans[:, 2] - min_x + 1), -1)
+    return np.cumsum(counts[:, :-1], axis=1, dtype=np.int8) > 0
+
+
+def save_fill(path, mask, origin=(0, 0), kind="bits"):
+    """Сохраняет заливку в .npz (np.savez_compressed).
+
+    kind - "bits" (упакованная маска) или "spans" (отрезки mask_spans). Вместе
+    с данными пишутся размер маски и смещение, load_fill и load_spans
+    читают оба формата.
+    """
+    if kind == "bits":
+        data = pack_mask(mask)
+    elif kind == "spans":
+        data = mask_spans(mask, origin)
+    else:
+        raise ValueError(f"Неизвестный формат заливки: {kind}")
+    np.savez_compressed(path, kind=kind, data=data, shape=np.asarray(mask.shape), origin=np.asarray(origin))
+
+
+def _read_fill(path):
+    """Содержимое файла save_fill: (kind, data, shape, origin)"""
+    with np.load(path) as f:
+        return str(f["kind"]), f["data"], tuple(int(v) for v in f["shape"]), tuple(int(v) for v in f["origin"])
+
+
+def load_fill(path):
+    """Читает заливку save_fill любого формата как (mask, min_x, min_y)"""
+    kind, data, shape, origin = _read_fill(path)
+    mask = unpack_mask(data, shape[1]) if kind == "bits" else spans_mask(data, shape, origin)
+    return mask, origin[0], origin[1]
+
+
+def load_spans(path):
+    """Читает заливку save_fill как отрезки (K, 3) в координатах холста.
+
+    Отрезки не зависят от размера маски, поэтому заливки из разных файлов
+    можно складывать без распаковки в маску.
+    """
+    kind, data, shape, origin = _read_fill(path)
+    return mask_spans(unpack_mask(data, shape[1]), origin) if kind == "bits" else data
@@ -2,52 +2,67 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+from hull import akl_toussaint, divide_conquer_hull, orientation, sorted_unique
 
-def cross_product(O, A, B):
-    """Векторное произведение: > 0 если B слева от OA, < 0 если справа"""
-    return (A[0] - O[0]) * (B[1] - O[1]) - (A[1] - O[1]) * (B[0] - O[0])
 
+class HullContext:
+    """Состояние одного построения оболочки: шаги для визуализации и их счётчик.
 
-# Глобальные переменные для визуализации
-visualization_steps = []
-step_counter = [0]
+    Создаётся на каждый вызов convex_hull_divide_conquer, поэтому построения
+    в разных потоках (и вложенные) не мешают друг другу.
+    """
+
+    def __init__(self):
+        self.steps = []
+        self.step_counter = 0
+
+    def next_step(self):
+        """Номер очередного шага"""
+        self.step_counter += 1
+        return self.step_counter
 
 
-def convex_hull_divide_conquer(points):
+def convex_hull_divide_conquer(points, trace=False, cull=False):
     """
     Строит выпуклую оболочку методом разделяй и властвуй
     Возвращает упорядоченный список индексов точек оболочки
+    trace=True - рекурсивный вариант с печатью хода алгоритма и записью шагов
+    для анимации; без него оболочка строится без рекурсии (divide_conquer_hull),
+    а список шагов пуст. Результат в обоих случаях один и тот же
+    cull=True - сначала отбросить внутренние точки (akl_toussaint); оболочка та же
     """
-    global visualization_steps, step_counter
-    visualization_steps = []
-    step_counter[0] = 0
-
     points = np.array(points)
     n = len(points)
+    kept = akl_toussaint(points) if cull else np.arange(n)
+    if not trace:
+        return kept[divide_conquer_hull(points[kept])].tolist(), [], points
+    context = HullContext()
 
-    # Создаём список индексов для отслеживания
-    indices = list(range(n))
-
-    # Сортируем точки по X, затем по Y
-    sorted_indices = sorted(indices, key=lambda i: (points[i][0], points[i][1]))
+    # Сортируем точки по X, затем по Y; из совпадающих берём первую
+    sorted_indices = kept[sorted_unique(points[kept].astype(np.float64))].tolist()
 
     print("=" * 70)
     print("АЛГОРИТМ РАЗДЕЛЯЙ И ВЛАСТВУЙ")
     print("=" * 70)
     print(f"Всего точек: {n}")
+    if cull:
+        print(f"Отброшено внутренних точек: {n - len(kept)}")
     print(f"Принцип: рекурсивно делим на две части, строим оболочки,")
     print(f"         затем объединяем их через верхнюю и нижнюю касательные")
     print("=" * 70)
 
     # Сохраняем начальный шаг
-    visualization_steps.append({
+    context.steps.append({
         'type': 'start',
         'all_points': sorted_indices,
         'message': 'Сортировка точек по X-координате'
     })
 
-    # Рекурсивный алгоритм
-    hull_indices = divide_and_conquer_recursive(points, sorted_indices, depth=0)
+    # Рекурсивный алгоритм; координаты списком - так доступ к ним в Python дешевле
+    hull_indices = divide_and_conquer_recursive(points.tolist(), sorted_indices, depth=0, context=context)
+    # Обход начинаем с самой левой (и нижней) точки, как в divide_conquer_hull
+    start = hull_indices.index(sorted_indices[0])
+    hull_indices = hull_indices[start:] + hull_indices[:start]
 
     print(f"\n{'=' * 70}")
     print(f"ПОСТРОЕНИЕ ЗАВЕРШЕНО!")
@@ -55,36 +70,36 @@ def convex_hull_divide_conquer(points):
     print(f"{'=' * 70}\n")
 
     # Финальный шаг
-    visualization_steps.append({
+    context.steps.append({
         'type': 'final',
         'hull': hull_indices
     })
 
-    return hull_indices, visualization_steps, points
-
+    return hull_indices, context.steps, points
 
-def divide_and_conquer_recursive(points, indices, depth=0):
-    """Рекурсивная функция разделяй и властвуй"""
-    global visualization_steps, step_counter
 
+def divide_and_conquer_recursive(points, indices, depth=0, context=None):
+    """Рекурсивная функция разделяй и властвуй (context=None - без трассировки)"""
     n = len(indices)
-    indent = "  " * depth
 
     # Базовый случай: 1-3 точки
     if n <= 3:
         hull = convex_hull_base_case(points, indices)
+        if context is None:
+            return hull
 
-        step_counter[0] += 1
-        print(f"\n{indent}[Шаг {step_counter[0]}] Базовый случай: {n} точки")
+        indent = "  " * depth
+        step = context.next_step()
+        print(f"\n{indent}[Шаг {step}] Базовый случай: {n} точки")
         print(f"{indent}Точки: {[f'P{i}' for i in indices]}")
         print(f"{indent}Оболочка: {[f'P{i}' for i in hull]}")
 
-        visualization_steps.append({
+        context.steps.append({
             'type': 'base_case',
             'indices': indices,
             'hull': hull,
             'depth': depth,
-            'step': step_counter[0]
+            'step': step
         })
 
         return hull
@@ -94,31 +109,36 @@ def divide_and_conquer_recursive(points, indices, depth=0):
     left_indices = indices[:mid]
     right_indices = indices[mid:]
 
-    step_counter[0] += 1
-    print(f"\n{indent}[Шаг {step_counter[0]}] РАЗДЕЛЕНИЕ на уровне {depth}")
-    print(f"{indent}Всего точек: {n}")
-    print(f"{indent}Левая часть ({len(left_indices)}): {[f'P{i}' for i in left_indices]}")
-    print(f"{indent}Правая часть ({len(right_indices)}): {[f'P{i}' for i in right_indices]}")
-
-    visualization_steps.append({
-        'type': 'divide',
-        'left': left_indices,
-        'right': right_indices,
-        'depth': depth,
-        'step': step_counter[0]
-    })
+    if context is not None:
+        indent = "  " * depth
+        step = context.next_step()
+        print(f"\n{indent}[Шаг {step}] РАЗДЕЛЕНИЕ на уровне {depth}")
+        print(f"{indent}Всего точек: {n}")
+        print(f"{indent}Левая часть ({len(left_indices)}): {[f'P{i}' for i in left_indices]}")
+        print(f"{indent}Правая часть ({len(right_indices)}): {[f'P{i}' for i in right_indices]}")
+
+        context.steps.append({
+            'type': 'divide',
+            'left': left_indices,
+            'right': right_indices,
+            'depth': depth,
+            'step': step
+        })
 
     # Рекурсивно строим оболочки
-    left_hull = divide_and_conquer_recursive(points, left_indices, depth + 1)
-    right_hull = divide_and_conquer_recursive(points, right_indices, depth + 1)
+    left_hull = divide_and_conquer_recursive(points, left_indices, depth + 1, context)
+    right_hull = divide_and_conquer_recursive(points, right_indices, depth + 1, context)
+
+    if context is None:
+        return merge_hulls(points, left_hull, right_hull, depth)
 
     # Объединяем оболочки
-    step_counter[0] += 1
-    print(f"\n{indent}[Шаг {step_counter[0]}] ОБЪЕДИНЕНИЕ на уровне {depth}")
+    step = context.next_step()
+    print(f"\n{indent}[Шаг {step}] ОБЪЕДИНЕНИЕ на уровне {depth}")
     print(f"{indent}Левая оболочка ({len(left_hull)}): {[f'P{i}' for i in left_hull]}")
     print(f"{indent}Правая оболочка ({len(right_hull)}): {[f'P{i}' for i in right_hull]}")
 
-    merged_hull = merge_hulls(points, left_hull, right_hull, depth)
+    merged_hull = merge_hulls(points, left_hull, right_hull, depth, context)
 
     print(f"{indent}Результат объединения ({len(merged_hull)}): {[f'P{i}' for i in merged_hull]}")
 
@@ -136,85 +156,90 @@ def convex_hull_base_case(points, indices):
     else:  # n == 3
         # Упорядочиваем против часовой стрелки
         i0, i1, i2 = indices
-        cross = cross_product(points[i0], points[i1], points[i2])
-        if cross > 0:  # Против часовой
+        side = orientation(points[i0], points[i1], points[i2])
+        if side > 0:  # Против часовой
             return [i0, i1, i2]
-        else:  # По часовой - разворачиваем
+        elif side < 0:  # По часовой - разворачиваем
             return [i0, i2, i1]
+        else:  # На одной прямой - средняя точка (по сортировке) не вершина
+            return [i0, i2]
 
 
-def merge_hulls(points, left_hull, right_hull, depth):
+def merge_hulls(points, left_hull, right_hull, depth, context=None):
     """Объединяет две выпуклые оболочки"""
-    global visualization_steps, step_counter
-
     # Находим верхнюю касательную
     upper_left, upper_right = find_upper_tangent(points, left_hull, right_hull)
 
-    step_counter[0] += 1
-    print(f"{'  ' * depth}  → Верхняя касательная: P{upper_left} -- P{upper_right}")
+    if context is not None:
+        step = context.next_step()
+        print(f"{'  ' * depth}  → Верхняя касательная: P{upper_left} -- P{upper_right}")
 
-    visualization_steps.append({
-        'type': 'upper_tangent',
-        'left_hull': left_hull,
-        'right_hull': right_hull,
-        'tangent': (upper_left, upper_right),
-        'depth': depth,
-        'step': step_counter[0]
-    })
+        context.steps.append({
+            'type': 'upper_tangent',
+            'left_hull': left_hull,
+            'right_hull': right_hull,
+            'tangent': (upper_left, upper_right),
+            'depth': depth,
+            'step': step
+        })
 
     # Находим нижнюю касательную
     lower_left, lower_right = find_lower_tangent(points, left_hull, right_hull)
 
-    step_counter[0] += 1
-    print(f"{'  ' * depth}  → Нижняя касательная: P{lower_left} -- P{lower_right}")
-
-    visualization_steps.append({
-        'type': 'lower_tangent',
-        'left_hull': left_hull,
-        'right_hull': right_hull,
-        'upper_tangent': (upper_left, upper_right),
-        'lower_tangent': (lower_left, lower_right),
-        'depth': depth,
-        'step': step_counter[0]
-    })
+    if context is not None:
+        step = context.next_step()
+        print(f"{'  ' * depth}  → Нижняя касательная: P{lower_left} -- P{lower_right}")
 
-    # Строим объединённую оболочку
-    merged = []
-
-    # Начинаем с верхней касательной на левой оболочке
-    idx = left_hull.index(upper_left)
-    while True:
-        current = left_hull[idx]
-        merged.append(current)
-        if current == lower_left:
-            break
-        idx = (idx + 1) % len(left_hull)
-
-    # Продолжаем по правой оболочке
-    idx = right_hull.index(lower_right)
-    while True:
-        current = right_hull[idx]
-        merged.append(current)
-        if current == upper_right:
-            break
-        idx = (idx + 1) % len(right_hull)
-
-    step_counter[0] += 1
-    visualization_steps.append({
-        'type': 'merge_complete',
-        'merged_hull': merged,
-        'depth': depth,
-        'step': step_counter[0]
-    })
+        context.steps.append({
+            'type': 'lower_tangent',
+            'left_hull': left_hull,
+            'right_hull': right_hull,
+            'upper_tangent': (upper_left, upper_right),
+            'lower_tangent': (lower_left, lower_right),
+            'depth': depth,
+            'step': step
+        })
+
+    # Строим объединённую оболочку: по левой от верхней касательной до нижней,
+    # затем по правой от нижней до верхней (обход по кругу - срезами)
+    start, end = left_hull.index(upper_left), left_hull.index(lower_left)
+    merged = left_hull[start:end + 1] if start <= end else left_hull[start:] + left_hull[:end + 1]
+    start, end = right_hull.index(lower_right), right_hull.index(upper_right)
+    merged += right_hull[start:end + 1] if start <= end else right_hull[start:] + right_hull[:end + 1]
+
+    if context is not None:
+        step = context.next_step()
+        context.steps.append({
+            'type': 'merge_complete',
+            'merged_hull': merged,
+            'depth': depth,
+            'step': step
+        })
 
     return merged
 
 
-def find_upper_tangent(points, left_hull, right_hull):
-    """Находит верхнюю касательную между двумя оболочками"""
+def tangent_moves(points, left, right, moving, candidate, sign):
+    """Сдвигать ли конец moving (left или right) касательной left -- right в candidate.
+
+    sign=1 для верхней касательной (сдвигаем, если candidate выше прямой),
+    sign=-1 для нижней (если ниже). Точку на самой прямой берём, только если
+    она дальше от другого конца, - так точки на касательной не попадают
+    в оболочку, а отрезок из двух точек не зацикливает поиск.
+    """
+    side = sign * orientation(points[left], points[right], points[candidate])
+    if side != 0:
+        return side > 0
+    fixed = right if moving == left else left
+    m, f, c = points[moving], points[fixed], points[candidate]
+    return (c[0] - m[0]) * (m[0] - f[0]) + (c[1] - m[1]) * (m[1] - f[1]) > 0
+
+
+def find_tangent(points, left_hull, right_hull, sign):
+    """Касательная к двум оболочкам (вершины против часовой стрелки): верхняя при sign=1, нижняя при sign=-1"""
     # Начинаем с самой правой точки левой оболочки и самой левой правой
-    left_idx = max(range(len(left_hull)), key=lambda i: points[left_hull[i]][0])
-    right_idx = min(range(len(right_hull)), key=lambda i: points[right_hull[i]][0])
+    left_idx = max(range(len(left_hull)), key=lambda i: points[left_hull[i]])
+    right_idx = min(range(len(right_hull)), key=lambda i: points[right_hull[i]])
 
     n_left = len(left_hull)
     n_right = len(right_hull)
@@ -223,67 +248,35 @@ def find_upper_tangent(points, left_hull, right_hull):
     while changed:
         changed = False
 
-        # Двигаем левую точку вверх
-        while True:
-            next_left = (left_idx - 1) % n_left
-            if cross_product(points[left_hull[left_idx]],
-                             points[right_hull[right_idx]],
-                             points[left_hull[next_left]]) <= 0:
-                left_idx = next_left
-                changed = True
-            else:
+        # Двигаем левую точку: вверх - против часовой стрелки, вниз - по ней
+        while n_left > 1:
+            next_left = (left_idx + sign) % n_left
+            if not tangent_moves(points, left_hull[left_idx], right_hull[right_idx],
+                                 left_hull[left_idx], left_hull[next_left], sign):
                 break
-
-        # Двигаем правую точку вверх
-        while True:
-            next_right = (right_idx + 1) % n_right
-            if cross_product(points[right_hull[right_idx]],
-                             points[left_hull[left_idx]],
-                             points[right_hull[next_right]]) >= 0:
-                right_idx = next_right
-                changed = True
-            else:
+            left_idx = next_left
+            changed = True
+
+        # Двигаем правую точку: вверх - по часовой стрелке, вниз - против
+        while n_right > 1:
+            next_right = (right_idx - sign) % n_right
+            if not tangent_moves(points, left_hull[left_idx], right_hull[right_idx],
+                                 right_hull[right_idx], right_hull[next_right], sign):
                 break
+            right_idx = next_right
+            changed = True
 
     return left_hull[left_idx], right_hull[right_idx]
 
 
-def find_lower_tangent(points, left_hull, right_hull):
-    """Находит нижнюю касательную между двумя оболочками"""
-    # Начинаем с самой правой точки левой оболочки и самой левой правой
-    left_idx = max(range(len(left_hull)), key=lambda i: points[left_hull[i]][0])
-    right_idx = min(range(len(right_hull)), key=lambda i: points[right_hull[i]][0])
-
-    n_left = len(left_hull)
-    n_right = len(right_hull)
-
-    changed = True
-    while changed:
-        changed = False
-
-        # Двигаем левую точку вниз
-        while True:
-            next_left = (left_idx + 1) % n_left
-            if cross_product(points[left_hull[left_idx]],
-                             points[right_hull[right_idx]],
-                             points[left_hull[next_left]]) >= 0:
-                left_idx = next_left
-                changed = True
-            else:
-                break
+def find_upper_tangent(points, left_hull, right_hull):
+    """Находит верхнюю касательную между двумя оболочками"""
+    return find_tangent(points, left_hull, right_hull, 1)
 
-        # Двигаем правую точку вниз
-        while True:
-            next_right = (right_idx - 1) % n_right
-            if cross_product(points[right_hull[right_idx]],
-                             points[left_hull[left_idx]],
-                             points[right_hull[next_right]]) <= 0:
-                right_idx = next_right
-                changed = True
-            else:
-                break
 
-    return left_hull[left_idx], right_hull[right_idx]
+def find_lower_tangent(points, left_hull, right_hull):
+    """Находит нижнюю касательную между двумя оболочками"""
+    return find_tangent(points, left_hull, right_hull, -1)
 
 
 def draw_convex_hull(points, hull_indices):
@@ -602,7 +595,7 @@ def main():
     print()
 
     # Строим оболочку
-    hull_indices, steps, points_arr = convex_hull_divide_conquer(points)
+    hull_indices, steps, points_arr = convex_hull_divide_conquer(points, trace=True)
 
     # Визуализация
     print("Показываем анимацию (закройте окно для итогового результата)...\n")
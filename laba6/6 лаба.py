@@ -2,19 +2,21 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 
+from hull import akl_toussaint, orientation
 
-def cross_product(O, A, B):
-    """Векторное произведение: > 0 если B слева от OA, < 0 если справа"""
-    return (A[0] - O[0]) * (B[1] - O[1]) - (A[1] - O[1]) * (B[0] - O[0])
 
-
-def convex_hull_brute_force(points):
+def convex_hull_brute_force(points, cull=False):
     """
     Строит выпуклую оболочку методом полного перебора
     Возвращает: (hull_edges, steps) - рёбра оболочки и шаги для визуализации
+    cull=True - перебирать только точки, оставшиеся после akl_toussaint;
+    отброшенные лежат строго внутри и рёбер не меняют (пропадают только
+    пары совпадающих внутренних точек, которые перебор считает рёбрами)
     """
     points = np.array(points)
     n = len(points)
+    candidates = akl_toussaint(points).tolist() if cull else list(range(n))
+    m = len(candidates)
     hull_edges = []
     steps = []
 
@@ -22,37 +24,39 @@ def convex_hull_brute_force(points):
     print("АЛГОРИТМ ПОЛНОГО ПЕРЕБОРА")
     print("=" * 70)
     print(f"Всего точек: {n}")
+    if cull:
+        print(f"Отброшено внутренних точек: {n - m}")
     print(f"Принцип: ребро в оболочке, если все точки по одну сторону от него")
-    print(f"Всего пар для проверки: {n * (n - 1) // 2}")
+    print(f"Всего пар для проверки: {m * (m - 1) // 2}")
     print("=" * 70)
 
     pair_count = 0
 
     # Перебираем все пары точек
-    for i in range(n):
-        for j in range(i + 1, n):
+    for a, i in enumerate(candidates):
+        for j in candidates[a + 1:]:
             pair_count += 1
             p1, p2 = points[i], points[j]
 
-            # Проверяем положение всех остальных точек
-            point_sides = []
+            # Проверяем положение всех остальных точек (отброшенные - 0)
+            point_sides = [0] * n
             left_count = 0
             right_count = 0
 
-            for k in range(n):
+            for k in candidates:
                 if k == i or k == j:
-                    point_sides.append(0)
                     continue
 
-                cross = cross_product(p1, p2, points[k])
+                # Знак без ошибок округления: на прямой - только точно коллинеарные
+                side = orientation(p1, p2, points[k])
 
-                if abs(cross) < 1e-10:  # Коллинеарные
-                    point_sides.append(0)
-                elif cross > 0:
-                    point_sides.append(1)  # Слева
+                if side == 0:  # Коллинеарные
+                    continue
+                elif side > 0:
+                    point_sides[k] = 1  # Слева
                     left_count += 1
                 else:
-                    point_sides.append(-1)  # Справа
+                    point_sides[k] = -1  # Справа
                     right_count += 1
 
             # Ребро валидно, если все точки с одной стороны
@@ -0,0 +1,305 @@
+import contextlib
+import importlib.util
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from hull import (IncrementalHull, akl_toussaint, brute_force_edges, convex_hull, divide_conquer_hull, is_convex_hull,
+                  orientation, parallel_hull)
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def load_script(filename, name):
+    """Импортирует скрипт лабораторной (в именах файлов пробелы)"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def best_time(run, repeat=3):
+    """Лучшее время из repeat запусков и результат последнего"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        result = run()
+        best = min(best, time.perf_counter() - t0)
+    return best, result
+
+
+def make_points(kind, n, seed=0):
+    """Точки (N, 2): uniform - в квадрате, gauss - нормальное облако, circle - на окружности,
+    grid - целочисленная решётка, collinear - на одной прямой, near - у прямой y = x
+    со сдвигами на несколько ulp (знак cross_product там решают ошибки округления),
+    cascade - парабола и точка далеко под ней: вершины нижней цепочки уходят по одной"""
+    rng = np.random.default_rng(seed)
+    if kind == "uniform":
+        return rng.uniform(0, 1000, (n, 2))
+    if kind == "gauss":
+        return rng.normal(0, 100, (n, 2))
+    if kind == "circle":
+        angles = rng.uniform(0, 2 * np.pi, n)
+        return 1000 * np.column_stack((np.cos(angles), np.sin(angles)))
+    if kind == "grid":
+        # Целые точки с повторами и множеством точек на одной прямой
+        side = max(2, int(np.sqrt(n)) // 2)
+        return rng.integers(0, side, (n, 2)).astype(np.float64)
+    if kind == "collinear":
+        t = rng.integers(-n, n + 1, n)
+        return np.column_stack((t, 2 * t + 1)).astype(np.float64)
+    if kind == "near":
+        t = rng.uniform(0, 1000, n)
+        return np.column_stack((t, t + rng.integers(-4, 5, n) * np.spacing(t)))
+    if kind == "cascade":
+        m = n - 3
+        k = np.arange(m + 1, dtype=np.float64)
+        return np.vstack([np.column_stack((k, k * k - (m + 1) * k)), [[m + 1, -1e12], [m + 2, 0]]])
+    raise ValueError(f"Неизвестный набор точек: {kind}")
+
+
+def hull_vertices(hull_edges):
+    """Множество вершин по списку рёбер"""
+    return {int(i) for edge in hull_edges for i in edge}
+
+
+def benchmark_brute_force(sizes=(25, 50, 100)):
+    """convex_hull_brute_force против convex_hull (печать перебора отбрасывается)"""
+    brute = load_script("6 лаба.py", "brute_force")
+    print(f"{'N':>6} {'перебор, с':>11} {'convex_hull, с':>15} {'вершин':>7}")
+    for n in sizes:
+        points = make_points("uniform", n)
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            edges, _, _ = brute.convex_hull_brute_force(points)
+        slow = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        hull_edges, hull_indices, _ = convex_hull(points)
+        fast = time.perf_counter() - t0
+        if hull_vertices(edges) != set(hull_indices.tolist()):
+            raise AssertionError("convex_hull и convex_hull_brute_force расходятся")
+        print(f"{n:>6} {slow:>11.3f} {fast:>15.5f} {len(hull_indices):>7}")
+
+
+def benchmark_hull(sizes=(10 ** 5, 10 ** 6, 10 ** 7), kinds=("uniform", "gauss", "circle")):
+    """Время convex_hull (монотонная цепочка) и divide_conquer_hull на больших наборах точек"""
+    print(f"\n{'набор':>8} {'N':>10} {'цепочка, с':>11} {'разд. и вл., с':>15} {'нс/точку':>9} {'вершин':>8}")
+    for kind in kinds:
+        for n in sizes:
+            points = make_points(kind, n)
+            t0 = time.perf_counter()
+            _, hull_indices, _ = convex_hull(points)
+            chain = time.perf_counter() - t0
+            t0 = time.perf_counter()
+            merged = divide_conquer_hull(points)
+            elapsed = time.perf_counter() - t0
+            if not np.array_equal(hull_indices, merged):
+                raise AssertionError("divide_conquer_hull и convex_hull расходятся")
+            print(f"{kind:>8} {n:>10} {chain:>11.3f} {elapsed:>15.3f} {chain / n * 1e9:>9.0f} "
+                  f"{len(hull_indices):>8}")
+
+
+def benchmark_cascade(sizes=(10 ** 4, 10 ** 5, 4 * 10 ** 5, 10 ** 6)):
+    """convex_hull и divide_conquer_hull на наборе cascade, где проходы half_hull
+    и block_chains удаляют по одной вершине: время должно расти линейно,
+    а не квадратично"""
+    print(f"\n{'N':>8} {'цепочка, с':>11} {'разд. и вл., с':>15}")
+    for n in sizes:
+        points = make_points("cascade", n)
+        chain, (_, hull_indices, _) = best_time(lambda: convex_hull(points), repeat=1)
+        merged, result = best_time(lambda: divide_conquer_hull(points), repeat=1)
+        if not np.array_equal(hull_indices, result) or not is_convex_hull(points, hull_indices):
+            raise AssertionError("convex_hull и divide_conquer_hull расходятся на cascade")
+        print(f"{n:>8} {chain:>11.3f} {merged:>15.3f}")
+
+
+def benchmark_parallel(n=10 ** 7, kind="uniform", workers=(1, 2, 4, 8)):
+    """Время parallel_hull при разном числе процессов против divide_conquer_hull"""
+    points = make_points(kind, n)
+    t0 = time.perf_counter()
+    reference = divide_conquer_hull(points)
+    single = time.perf_counter() - t0
+    print(f"\nразделяй и властвуй, {kind}, N = {n}, ядер {os.cpu_count()}")
+    print(f"{'процессов':>10} {'время, с':>9} {'ускорение':>10}")
+    print(f"{'-':>10} {single:>9.3f} {1:>9.2f}x")
+    for count in workers:
+        t0 = time.perf_counter()
+        merged = parallel_hull(points, count)
+        elapsed = time.perf_counter() - t0
+        if not np.array_equal(merged, reference):
+            raise AssertionError("parallel_hull и divide_conquer_hull расходятся")
+        print(f"{count:>10} {elapsed:>9.3f} {single / elapsed:>9.2f}x")
+
+
+def benchmark_stream(n=10 ** 6, batch_sizes=(100, 10 ** 4), kinds=("uniform", "gauss")):
+    """IncrementalHull на потоке порций против monotone_chain по всем точкам сразу"""
+    print(f"\n{'набор':>8} {'порция':>7} {'поток, с':>9} {'сразу, с':>9} {'отброшено':>10} {'вершин':>7}")
+    for kind in kinds:
+        points = make_points(kind, n)
+        t0 = time.perf_counter()
+        _, reference, _ = convex_hull(points)
+        whole = time.perf_counter() - t0
+        for size in batch_sizes:
+            stream = IncrementalHull()
+            t0 = time.perf_counter()
+            for start in range(0, n, size):
+                stream.add(points[start:start + size])
+            elapsed = time.perf_counter() - t0
+            if not np.array_equal(stream.ids, reference):
+                raise AssertionError("IncrementalHull и convex_hull расходятся")
+            print(f"{kind:>8} {size:>7} {elapsed:>9.3f} {whole:>9.3f} {stream.discarded:>10} {len(stream.ids):>7}")
+
+
+def check_cull(n=10 ** 4, chunk_sizes=(4, 64, 1 << 16), seed=0):
+    """akl_toussaint не меняет оболочку, в том числе когда целые блоки точек лежат
+    во вписанном прямоугольнике (плотное ядро в начале массива)"""
+    rng = np.random.default_rng(seed)
+    core = np.vstack([rng.normal(0, 1, (n, 2)), rng.normal(0, 100, (n, 2))])
+    for points in (make_points("gauss", n, seed), make_points("uniform", n, seed), core):
+        expected = convex_hull(points)[1]
+        for size in chunk_sizes:
+            kept = akl_toussaint(points, chunk_size=size)
+            if not np.array_equal(kept[convex_hull(points[kept])[1]], expected):
+                raise AssertionError(f"akl_toussaint (chunk_size = {size}) изменил оболочку")
+    print(f"\nakl_toussaint сохраняет оболочку при блоках {', '.join(map(str, chunk_sizes))}")
+
+
+def benchmark_cull(brute_sizes=(50, 100, 150), sizes=(10 ** 5, 10 ** 6, 10 ** 7), kinds=("uniform", "gauss")):
+    """Сколько точек отсекает akl_toussaint и во сколько раз он ускоряет оба алгоритма целиком
+    (время с отсечением включает сам akl_toussaint)"""
+    brute = load_script("6 лаба.py", "brute_force")
+    script = load_script("5 варик.py", "divide_conquer")
+
+    def brute_edges(points, cull):
+        with contextlib.redirect_stdout(io.StringIO()):
+            edges, _, _ = brute.convex_hull_brute_force(points, cull=cull)
+        # Пары совпадающих точек перебор считает рёбрами, сравниваем без них
+        return [e for e in edges if (points[e[0]] != points[e[1]]).any()]
+
+    print(f"\n{'алгоритм':>10} {'набор':>8} {'N':>10} {'отсечено':>10} {'без, с':>9} {'с отсеч., с':>12} {'ускорение':>10}")
+    for name, run, counts in (("перебор", brute_edges, brute_sizes),
+                              ("разд. и вл.", lambda p, cull: script.convex_hull_divide_conquer(p, cull=cull)[0], sizes)):
+        for kind in kinds:
+            for n in counts:
+                points = make_points(kind, n)
+                culled = n - len(akl_toussaint(points))
+                plain, expected = best_time(lambda: run(points, False), repeat=1)
+                fast, result = best_time(lambda: run(points, True), repeat=1)
+                if result != expected:
+                    raise AssertionError(f"{name}: оболочка с отсечением другая")
+                print(f"{name:>10} {kind:>8} {n:>10} {culled:>10} {plain:>9.3f} {fast:>12.3f} {plain / fast:>9.1f}x")
+
+
+def benchmark_trace(n=10 ** 5, kind="uniform"):
+    """convex_hull_divide_conquer без трассировки и с ней (печать уходит в os.devnull)"""
+    script = load_script("5 варик.py", "divide_conquer")
+    points = make_points(kind, n)
+    t0 = time.perf_counter()
+    quiet, steps, _ = script.convex_hull_divide_conquer(points)
+    silent = time.perf_counter() - t0
+    with open(os.devnull, "w") as sink, contextlib.redirect_stdout(sink):
+        t0 = time.perf_counter()
+        traced, traced_steps, _ = script.convex_hull_divide_conquer(points, trace=True)
+        verbose = time.perf_counter() - t0
+    if quiet != traced or steps:
+        raise AssertionError("trace меняет результат convex_hull_divide_conquer")
+    print(f"\nразделяй и властвуй, {kind}, N = {n}: без трассировки {silent:.3f} с, "
+          f"с трассировкой {verbose:.3f} с ({len(traced_steps)} шагов), в {verbose / silent:.1f} раз")
+
+
+def check_concurrent(count=300, workers=16, seed=0):
+    """Одновременные convex_hull_divide_conquer в пуле потоков.
+
+    Каждое построение с трассировкой и без неё сравнивается с тем же
+    построением, выполненным заранее последовательно: оболочка и шаги
+    должны совпасть, если вызовы не делят общее состояние.
+    """
+    script = load_script("5 варик.py", "divide_conquer")
+    rng = np.random.default_rng(seed)
+    jobs = [(rng.uniform(0, 100, (rng.integers(4, 64), 2)), bool(k % 2)) for k in range(count)]
+
+    def run(job):
+        points, trace = job
+        hull_indices, steps, _ = script.convex_hull_divide_conquer(points, trace=trace)
+        return hull_indices, steps
+
+    # Печать трассировки из всех потоков отбрасывается целиком
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = [run(job) for job in jobs]
+        with ThreadPoolExecutor(workers) as pool:
+            results = list(pool.map(run, jobs))
+    failed = sum(got != want for got, want in zip(results, expected))
+    if failed:
+        raise AssertionError(f"{failed} из {count} параллельных построений разошлись с последовательными")
+    print(f"\n{count} построений в {workers} потоках совпали с последовательными")
+
+
+def check_differential(sizes=(2, 3, 10, 100, 1000, 10 ** 4), kinds=("uniform", "grid", "circle", "collinear", "near"),
+                       brute_limit=300, trace_limit=300, repeats=5):
+    """Сравнивает convex_hull_divide_conquer с оракулами.
+
+    Каждая оболочка проверяется is_convex_hull. До brute_limit точек рёбра
+    оболочки сверяются с полным перебором brute_force_edges: каждое ребро
+    есть среди найденных перебором, а концы рёбер перебора лежат на границе
+    оболочки. До trace_limit точек рекурсивный вариант с трассировкой должен
+    дать ту же оболочку.
+    """
+    script = load_script("5 варик.py", "divide_conquer")
+    print(f"\n{'набор':>10} {'N':>6} {'проверок':>9} {'оракул, с':>10}")
+    for kind in kinds:
+        for n in sizes:
+            elapsed = 0
+            for seed in range(repeats):
+                points = make_points(kind, n, seed)
+                hull_indices, _, _ = script.convex_hull_divide_conquer(points)
+                t0 = time.perf_counter()
+                if not is_convex_hull(points, hull_indices):
+                    raise AssertionError(f"{kind}, N = {n}, seed = {seed}: неверная оболочка")
+                if n <= brute_limit:
+                    edges = brute_force_edges(points)
+                    hull_edges = {frozenset(e) for e in zip(hull_indices, hull_indices[1:] + hull_indices[:1])
+                                  if e[0] != e[1]}
+                    if not hull_edges <= {frozenset(e) for e in edges.tolist()}:
+                        raise AssertionError(f"{kind}, N = {n}, seed = {seed}: ребро не подтверждено перебором")
+                    # Пары совпадающих точек перебор считает рёбрами при любых остальных точках
+                    distinct = (points[edges[:, 0]] != points[edges[:, 1]]).any(axis=1)
+                    boundary = np.unique(edges[distinct])
+                    # Точка на границе выпуклой оболочки, если добавление её в вершины
+                    # не меняет оболочку: она лежит на одной из сторон
+                    for k in boundary.tolist():
+                        if k not in hull_indices and not on_boundary(points, hull_indices, k):
+                            raise AssertionError(f"{kind}, N = {n}, seed = {seed}: P{k} вне границы оболочки")
+                elapsed += time.perf_counter() - t0
+                if n <= trace_limit:
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        traced, _, _ = script.convex_hull_divide_conquer(points, trace=True)
+                    if traced != hull_indices:
+                        raise AssertionError(f"{kind}, N = {n}, seed = {seed}: трассировка дала другую оболочку")
+            print(f"{kind:>10} {n:>6} {repeats:>9} {elapsed / repeats:>10.4f}")
+
+
+def on_boundary(points, hull_indices, k):
+    """Лежит ли точка k на одной из сторон оболочки"""
+    points = np.asarray(points, dtype=np.float64)
+    p = points[k]
+    for a, b in zip(hull_indices, hull_indices[1:] + hull_indices[:1]):
+        a, b = points[a], points[b]
+        if orientation(a, b, p) == 0 and (p - a) @ (b - a) >= 0 and (p - b) @ (a - b) >= 0:
+            return True
+    return False
+
+
+if __name__ == "__main__":
+    check_differential()
+    check_concurrent()
+    check_cull()
+    benchmark_brute_force()
+    benchmark_hull()
+    benchmark_cascade()
+    benchmark_parallel()
+    benchmark_stream()
+    benchmark_cull()
+    benchmark_trace()
@@ -0,0 +1,609 @@
+"""Выпуклая оболочка без визуализации (зависит только от numpy)."""
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+
+def cross_product(O, A, B):
+    """Векторное произведение: > 0 если B слева от OA, < 0 если справа"""
+    return (A[0] - O[0]) * (B[1] - O[1]) - (A[1] - O[1]) * (B[0] - O[0])
+
+
+# Оценка относительной ошибки cross_product в double (Shewchuk, orient2d):
+# |cross - точное| <= ORIENT_ERROR * (|первое произведение| + |второе произведение|)
+EPSILON = np.finfo(np.float64).eps / 2
+ORIENT_ERROR = (3 + 16 * EPSILON) * EPSILON
+
+
+def exact_orientation(ox, oy, ax, ay, bx, by):
+    """Знак векторного произведения в точной целочисленной арифметике.
+
+    Каждое double - это p / 2^k; после приведения к общему знаменателю
+    координаты - целые Python, и произведение считается без округлений.
+    """
+    ratios = [float(v).as_integer_ratio() for v in (ox, oy, ax, ay, bx, by)]
+    scale = max(q for _, q in ratios)
+    ox, oy, ax, ay, bx, by = (p * (scale // q) for p, q in ratios)
+    cross = (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+    return (cross > 0) - (cross < 0)
+
+
+def exact_in_double(values):
+    """Для каких наборов координат (столбцы values) cross_product в double точен:
+    все координаты - целые по модулю меньше 2^25"""
+    return ((values == np.round(values)) & (np.abs(values) < 2 ** 25)).all(axis=0)
+
+
+def orientation(O, A, B):
+    """Знак cross_product без ошибок округления: 1 - B слева от OA, -1 - справа, 0 - на прямой.
+
+    Произведение считается в double; если оно по модулю больше оценки
+    ошибки, его знак верен. Иначе, если double считает точно (exact_in_double),
+    берётся тот же знак, а в остальных случаях - exact_orientation.
+    Для скаляров - int, для массивов (как в cross_product) - массив из -1, 0, 1.
+    """
+    left = (A[0] - O[0]) * (B[1] - O[1])
+    right = (A[1] - O[1]) * (B[0] - O[0])
+    cross = left - right
+    bound = ORIENT_ERROR * (abs(left) + abs(right))
+    if np.ndim(cross) == 0:
+        if cross > bound:
+            return 1
+        if cross < -bound:
+            return -1
+        values = (O[0], O[1], A[0], A[1], B[0], B[1])
+        if exact_in_double(np.array(values, dtype=np.float64)):
+            return int(np.sign(cross))
+        return exact_orientation(*values)
+    sign = np.sign(cross)
+    ambiguous = np.flatnonzero(np.abs(cross) <= bound)
+    if len(ambiguous):
+        values = np.array([c.ravel()[ambiguous] for c in np.broadcast_arrays(O[0], O[1], A[0], A[1], B[0], B[1])],
+                          dtype=np.float64)
+        rest = np.flatnonzero(~exact_in_double(values))
+        flat = sign.reshape(-1)
+        flat[ambiguous[rest]] = [exact_orientation(*c) for c in zip(*values[:, rest].tolist())]
+    return sign
+
+
+def cross_bound(A, B, x, y):
+    """Оценка ошибки cross_product(A, B, (x, y)) сразу для всех точек (x, y).
+
+    Статический фильтр: оценка берётся по разбросу x, y вокруг A, поэтому
+    стоит несколько свёрток, а не лишние операции на каждую точку.
+    Для пустого набора точек - 0.
+    """
+    if not np.size(x):
+        return 0
+    reach_x = np.maximum(x.max() - A[0], A[0] - x.min())
+    reach_y = np.maximum(y.max() - A[1], A[1] - y.min())
+    return ORIENT_ERROR * (np.abs(B[0] - A[0]) * reach_y + np.abs(B[1] - A[1]) * reach_x)
+
+
+def strictly_left(A, B, x, y):
+    """Какие точки (x, y) наверняка строго левее прямой A -> B.
+
+    Сомнительные точки считаются не левее: отсечение их оставляет, а дальше
+    их положение определяет orientation.
+    """
+    return cross_product(A, B, (x, y)) > cross_bound(A, B, x, y)
+
+
+def line_sides(A, B, x, y):
+    """cross_product(A, B, (x, y)) с верным знаком: где он меньше cross_bound, заменён на orientation"""
+    cross = cross_product(A, B, (x, y))
+    ambiguous = np.flatnonzero(np.abs(cross) <= cross_bound(A, B, x, y))
+    if len(ambiguous):
+        cross[ambiguous] = orientation(A, B, (x[ambiguous], y[ambiguous]))
+    return cross
+
+
+def chain_turns(cx, cy, bound):
+    """Повороты соседних троек цепочки (cross_product) с верным знаком.
+
+    bound - оценка ошибки для всех троек: 2 * ORIENT_ERROR * (разброс X) * (разброс Y);
+    повороты не больше неё по модулю пересчитываются orientation.
+    """
+    turn = (cx[1:-1] - cx[:-2]) * (cy[2:] - cy[:-2]) - (cy[1:-1] - cy[:-2]) * (cx[2:] - cx[:-2])
+    ambiguous = np.flatnonzero(np.abs(turn) <= bound)
+    if len(ambiguous):
+        turn[ambiguous] = orientation((cx[ambiguous], cy[ambiguous]), (cx[ambiguous + 1], cy[ambiguous + 1]),
+                                      (cx[ambiguous + 2], cy[ambiguous + 2]))
+    return turn
+
+
+def chain_bound(x, y):
+    """Оценка ошибки chain_turns для любых троек точек из x, y"""
+    return 2 * ORIENT_ERROR * np.ptp(x) * np.ptp(y) if len(x) else 0
+
+
+def sorted_unique(points):
+    """Индексы точек, отсортированных по X, затем по Y, без повторов.
+
+    Из совпадающих точек остаётся точка с наименьшим индексом.
+    """
+    x, y = points[:, 0], points[:, 1]
+    order = np.argsort(x)
+    xs = x[order]
+    tie = np.zeros(len(order), dtype=bool)
+    tie[1:] = xs[1:] == xs[:-1]
+    tie[:-1] |= tie[1:]
+    if tie.any():
+        # Досортировываем по Y только группы с одинаковым X (они идут подряд)
+        group = order[tie]
+        order[tie] = group[np.lexsort((group, y[group], x[group]))]
+        ys = y[order]
+        keep = np.ones(len(order), dtype=bool)
+        keep[1:] = (xs[1:] != xs[:-1]) | (ys[1:] != ys[:-1])
+        order = order[keep]
+    return order
+
+
+def akl_toussaint(points, chunk_size=1 << 16):
+    """Индексы точек, оставшихся после отсечения Акла - Туссена (по возрастанию).
+
+    Крайние точки по min/max x, y, x + y, x - y лежат на оболочке; точки
+    строго внутри восьмиугольника на них вершинами оболочки быть не могут
+    и отбрасываются. Точки на его сторонах остаются, поэтому оболочка
+    оставшихся точек (в исходных индексах) та же, что у всех точек.
+    Точки обходятся блоками по chunk_size, чтобы временные массивы
+    помещались в кэш.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    if n < 3:
+        return np.arange(n)
+    # Крайние точки блоков, затем крайние среди них
+    best = []
+    for start in range(0, n, chunk_size):
+        x, y = points[start:start + chunk_size, 0], points[start:start + chunk_size, 1]
+        best.append([start + k for k in (np.argmin(x), np.argmin(x + y), np.argmin(y), np.argmax(x - y),
+                                         np.argmax(x), np.argmax(x + y), np.argmax(y), np.argmin(x - y))])
+    best = np.array(best)
+    x, y = points[best, 0], points[best, 1]
+    # Направления против часовой стрелки, начиная с крайней левой точки
+    columns = np.arange(8)
+    corners = best[np.array([np.argmin(x[:, 0]), np.argmin((x + y)[:, 1]), np.argmin(y[:, 2]),
+                             np.argmax((x - y)[:, 3]), np.argmax(x[:, 4]), np.argmax((x + y)[:, 5]),
+                             np.argmax(y[:, 6]), np.argmin((x - y)[:, 7])]), columns]
+    octagon = [points[k] for k in corners.tolist()]
+    # Прямоугольник внутри восьмиугольника: точки в нём отсекаются четырьмя
+    # сравнениями, векторные произведения считаются только для остальных
+    cx, cy = points[corners, 0], points[corners, 1]
+    left, right = cx[[7, 0, 1]].max(), cx[[3, 4, 5]].min()
+    bottom, top = cy[[1, 2, 3]].max(), cy[[5, 6, 7]].min()
+    octagon = [p for p, q in zip(octagon, octagon[1:] + octagon[:1]) if (p != q).any()]
+    if len(octagon) < 3:
+        return np.arange(n)
+    edges = list(zip(octagon, octagon[1:] + octagon[:1]))
+    # Углы прямоугольника могут выйти за косые стороны - тогда сжимаем его к центру
+    center = np.mean(octagon, axis=0)
+    bounds = np.array([[left, right], [bottom, top]])
+    for scale in (1, 0.99, 0.9, 0.5, 0):
+        (left, right), (bottom, top) = center[:, None] + scale * (bounds - center[:, None])
+        box = np.array([[left, right, right, left], [bottom, bottom, top, top]])
+        if all((orientation(a, b, box) > 0).all() for a, b in edges):
+            break
+    kept = []
+    for start in range(0, n, chunk_size):
+        x, y = points[start:start + chunk_size, 0], points[start:start + chunk_size, 1]
+        rest = np.flatnonzero((x <= left) | (x >= right) | (y <= bottom) | (y >= top))
+        inside = np.ones(len(rest), dtype=bool)
+        for a, b in edges:
+            inside &= strictly_left(a, b, x[rest], y[rest])
+        kept.append(start + rest[~inside])
+    return np.concatenate(kept)
+
+
+def stack_chain(x, y, chain):
+    """Нижняя цепочка обычным стеком алгоритма Эндрю: O(len(chain)) поворотов.
+
+    Поворот считается в double прямо здесь, orientation вызывается, только
+    когда он не больше оценки ошибки.
+    """
+    xs, ys = x[chain].tolist(), y[chain].tolist()
+    sx, sy, stack = [], [], []
+    for k, (px, py) in enumerate(zip(xs, ys)):
+        while len(stack) > 1:
+            ox, oy, ax, ay = sx[-2], sy[-2], sx[-1], sy[-1]
+            left = (ax - ox) * (py - oy)
+            right = (ay - oy) * (px - ox)
+            cross = left - right
+            if cross > ORIENT_ERROR * (abs(left) + abs(right)):
+                break
+            if cross >= -ORIENT_ERROR * (abs(left) + abs(right)) and orientation((ox, oy), (ax, ay), (px, py)) > 0:
+                break
+            sx.pop(), sy.pop(), stack.pop()
+        sx.append(px), sy.append(py), stack.append(k)
+    return chain[stack]
+
+
+def half_hull(x, y, chain, passes=16):
+    """Нижняя цепочка оболочки: позиции chain в массивах x, y, упорядоченных по X, затем по Y.
+
+    За один проход удаляются все точки, где цепочка не поворачивает строго
+    влево: такая точка лежит не ниже хорды соседей и вершиной не является.
+    Когда удалять нечего, цепочка локально выпукла, а значит и выпукла.
+    Проходы обходят в сумме не больше passes длин исходной цепочки; если
+    удаления идут каскадом и этого не хватило, цепочка достраивается
+    stack_chain - так на точку приходится O(1) работы и в худшем случае.
+    Коллинеарные точки в цепочку не входят. Для верхней цепочки передаётся
+    chain в обратном порядке.
+    """
+    # Координаты цепочки храним рядом с ней: соседи - это срезы, а не выборки
+    cx, cy = x[chain], y[chain]
+    bound = chain_bound(cx, cy)
+    budget = passes * len(chain)
+    while len(chain) > 2:
+        if budget < len(chain):
+            return stack_chain(x, y, chain)
+        budget -= len(chain)
+        left = chain_turns(cx, cy, bound) > 0
+        if left.all():
+            break
+        keep = np.ones(len(chain), dtype=bool)
+        keep[1:-1] = left
+        chain, cx, cy = chain[keep], cx[keep], cy[keep]
+    return chain
+
+
+def monotone_chain(points):
+    """Индексы вершин выпуклой оболочки (алгоритм Эндрю), O(n log n).
+
+    Вершины против часовой стрелки, начиная с самой левой (и нижней) точки.
+    Точки на сторонах оболочки не входят, из совпадающих точек берётся точка
+    с наименьшим индексом. Для одной точки (или одинаковых) - одна вершина,
+    для точек на одной прямой - два конца отрезка.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    order = sorted_unique(points)
+    if len(order) <= 2:
+        return order
+
+    # Точки под прямой от крайней левой к крайней правой - кандидаты
+    # нижней цепочки, над ней - верхней
+    x, y = points[order, 0], points[order, 1]
+    side = line_sides((x[0], y[0]), (x[-1], y[-1]), x, y)
+    positions = np.arange(len(order))
+    lower = half_hull(x, y, positions[side <= 0])
+    upper = half_hull(x, y, positions[side >= 0][::-1])
+    return order[np.concatenate([lower[:-1], upper[:-1]])]
+
+
+def convex_hull(points):
+    """Выпуклая оболочка множества точек.
+
+    Возвращает (hull_edges, hull_indices, points): рёбра оболочки массивом (h, 2)
+    пар индексов, вершины против часовой стрелки и точки массивом numpy -
+    как convex_hull_brute_force, но за O(n log n).
+    """
+    points = np.asarray(points, dtype=np.float64)
+    hull_indices = monotone_chain(points)
+    if len(hull_indices) < 2:
+        hull_edges = np.empty((0, 2), dtype=np.int64)
+    elif len(hull_indices) == 2:
+        hull_edges = hull_indices[None, :]
+    else:
+        hull_edges = np.column_stack((hull_indices, np.roll(hull_indices, -1)))
+    return hull_edges, hull_indices, points
+
+
+class IncrementalHull:
+    """Выпуклая оболочка потока точек, обновляемая порциями.
+
+    Хранятся только вершины текущей оболочки: points - их координаты против
+    часовой стрелки, ids - номера в потоке (по порядку поступления). Точки
+    порции строго внутри оболочки отбрасываются сразу (strictly_left),
+    остальные вместе с вершинами идут в monotone_chain. Вершины после
+    каждой порции те же, что у monotone_chain по всем точкам потока.
+    """
+
+    def __init__(self, chunk_size=1 << 22):
+        self.points = np.empty((0, 2), dtype=np.float64)
+        self.ids = np.empty(0, dtype=np.int64)
+        self.count = 0
+        self.discarded = 0
+        self.chunk_size = chunk_size
+
+    def inside(self, points):
+        """Какие точки наверняка лежат строго внутри текущей оболочки"""
+        inside = np.zeros(len(points), dtype=bool)
+        if len(self.points) < 3:
+            return inside
+        a, b = self.points.T, np.roll(self.points, -1, axis=0).T
+        step = max(1, self.chunk_size // len(self.points))
+        for start in range(0, len(points), step):
+            p = points[start:start + step, :, None]
+            # Строго левее каждой стороны, обходимой против часовой стрелки
+            inside[start:start + step] = strictly_left(a, b, p[:, 0], p[:, 1]).all(axis=1)
+        return inside
+
+    def add(self, points_batch):
+        """Добавляет порцию точек (M, 2), возвращает число отброшенных внутренних"""
+        batch = np.asarray(points_batch, dtype=np.float64).reshape(-1, 2)
+        ids = self.count + np.arange(len(batch))
+        self.count += len(batch)
+        outside = ~self.inside(batch)
+        discarded = len(batch) - int(outside.sum())
+        self.discarded += discarded
+        if discarded < len(batch):
+            # Вершины идут первыми: из совпадающих точек остаётся более ранняя
+            candidates = np.concatenate([self.points, batch[outside]])
+            candidate_ids = np.concatenate([self.ids, ids[outside]])
+            order = monotone_chain(candidates)
+            self.points, self.ids = candidates[order], candidate_ids[order]
+        return discarded
+
+    def hull(self):
+        """(hull_indices, points) для draw_convex_hull: индексы вершин в points и сами вершины"""
+        return np.arange(len(self.points)), self.points.copy()
+
+
+def block_chains(x, y, size, sign, passes=16):
+    """Нижние (sign=1) или верхние (sign=-1) цепочки блоков по size точек.
+
+    x, y упорядочены по X, затем по Y. Блоки обрабатываются одновременно,
+    как в half_hull, только соседние тройки не переходят границу блока.
+    Как и в half_hull, проходы обходят в сумме не больше passes длин
+    массива; блоки, где удаления ещё идут, достраиваются stack_chain.
+    Возвращает (chain, counts): позиции вершин всех цепочек подряд и длины цепочек.
+    """
+    chain = np.arange(len(x))
+    block = chain // size
+    blocks = (len(x) + size - 1) // size
+    active = np.arange(blocks)
+    cx, cy = x, y
+    bound = chain_bound(x, y)
+    budget = passes * len(chain)
+    while len(chain) > 2:
+        if budget < len(chain):
+            # Блоки без удалений на последнем проходе уже выпуклы
+            starts = np.searchsorted(block, np.arange(blocks + 1))
+            pieces = [chain[starts[b]:starts[b + 1]] for b in range(blocks)]
+            for b in np.unique(active).tolist():
+                # Верхняя цепочка - нижняя для точек в обратном порядке
+                pieces[b] = stack_chain(x, y, pieces[b]) if sign > 0 else stack_chain(x, y, pieces[b][::-1])[::-1]
+            chain = np.concatenate(pieces)
+            block = chain // size
+            break
+        budget -= len(chain)
+        turn = chain_turns(cx, cy, bound)
+        drop = (block[:-2] == block[2:]) & (sign * turn <= 0)
+        if not drop.any():
+            break
+        active = block[1:-1][drop]
+        keep = np.ones(len(chain), dtype=bool)
+        keep[1:-1] = ~drop
+        chain, block, cx, cy = chain[keep], block[keep], cx[keep], cy[keep]
+    return chain, np.bincount(block, minlength=blocks)
+
+
+def bridge(x, y, buffer, left, right, sign):
+    """Мост между соседними цепочками buffer[left[0]:left[1]] и buffer[right[0]:right[1]].
+
+    Для нижних цепочек (sign=1) ищутся позиции i, j, при которых все точки
+    обеих цепочек не ниже прямой buffer[i] - buffer[j], для верхних (sign=-1) -
+    не выше. Точки на самой прямой тоже отбрасываются. i идёт только влево,
+    j только вправо, поэтому поиск не зацикливается.
+    """
+    i, j = left[1] - 1, right[0]
+    changed = True
+    while changed:
+        changed = False
+        a, b = buffer[i], buffer[j]
+        while i > left[0]:
+            c = buffer[i - 1]
+            if sign * orientation((x[a], y[a]), (x[b], y[b]), (x[c], y[c])) > 0:
+                break
+            i, a, changed = i - 1, c, True
+        while j < right[1] - 1:
+            c = buffer[j + 1]
+            if sign * orientation((x[a], y[a]), (x[b], y[b]), (x[c], y[c])) > 0:
+                break
+            j, b, changed = j + 1, c, True
+    return i, j
+
+
+def merge_chains(x, y, chain, blocks, sign):
+    """Сливает соседние цепочки попарно снизу вверх, пока не останется одна.
+
+    blocks - границы [start, end) цепочек в буфере chain, слева направо
+    по X; x, y - координаты по позициям из chain (списками Python: мосты ищутся
+    поточечно, и числа Python здесь быстрее скаляров numpy). Правая часть
+    каждой пары сдвигается в том же буфере. Возвращает итоговую цепочку.
+    """
+    while len(blocks) > 1:
+        merged = []
+        for left, right in zip(blocks[::2], blocks[1::2]):
+            i, j = bridge(x, y, chain, left, right, sign)
+            length = right[1] - j
+            chain[i + 1:i + 1 + length] = chain[j:right[1]]
+            merged.append((left[0], i + 1 + length))
+        if len(blocks) % 2:
+            merged.append(blocks[-1])
+        blocks = merged
+    return chain[blocks[0][0]:blocks[0][1]]
+
+
+def hull_chains(x, y, leaf_size=1024):
+    """Нижняя и верхняя цепочки (позиции в x, y, слева направо) для различных точек,
+    упорядоченных по X, затем по Y"""
+    xs, ys = x.tolist(), y.tolist()
+    chains = []
+    for sign in (1, -1):
+        chain, counts = block_chains(x, y, leaf_size, sign)
+        # Цепочки блоков лежат в буфере подряд
+        ends = np.cumsum(counts)
+        chains.append(merge_chains(xs, ys, chain, list(zip((ends - counts).tolist(), ends.tolist())), sign))
+    return chains
+
+
+def join_chains(lower, upper):
+    """Вершины оболочки против часовой стрелки из нижней и верхней цепочек"""
+    if len(lower) == 1:
+        return lower
+    return np.concatenate([lower[:-1], upper[:0:-1]])
+
+
+def divide_conquer_hull(points, leaf_size=1024):
+    """Индексы вершин выпуклой оболочки методом разделяй и властвуй, без рекурсии.
+
+    Отсортированные точки делятся на блоки по leaf_size, их нижние и верхние
+    цепочки строятся сразу для всех блоков. Дальше соседние блоки попарно
+    сливаются снизу вверх: мост находится на цепочках, правая часть цепочки
+    сдвигается в том же буфере. Результат тот же, что у monotone_chain.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    order = sorted_unique(points)
+    if len(order) <= 2:
+        return order
+    lower, upper = hull_chains(points[order, 0], points[order, 1], leaf_size)
+    return order[join_chains(lower, upper)]
+
+
+def _slab_chains(task):
+    """Цепочки оболочки одной полосы точек из общей памяти (в исходных индексах)"""
+    coords_name, index_name, n, start, end, leaf_size = task
+    coords_memory = shared_memory.SharedMemory(name=coords_name)
+    index_memory = shared_memory.SharedMemory(name=index_name)
+    try:
+        coords = np.ndarray((n, 2), dtype=np.float64, buffer=coords_memory.buf)[start:end]
+        index = np.ndarray(n, dtype=np.int64, buffer=index_memory.buf)[start:end]
+        local = sorted_unique(coords)
+        lower, upper = hull_chains(coords[local, 0], coords[local, 1], leaf_size)
+        result = index[local[lower]], index[local[upper]]
+        del coords, index
+    finally:
+        coords_memory.close()
+        index_memory.close()
+    return result
+
+
+def parallel_hull(points, workers=None, parts=None, leaf_size=1024, sample_size=1 << 16):
+    """Оболочка разделяй и властвуй, верхние уровни которой считаются в пуле процессов.
+
+    Точки делятся по X на parts полос (по умолчанию по числу процессов) с
+    границами по квантилям выборки, так что одинаковые X попадают в одну
+    полосу. Координаты, переставленные по полосам, и исходные индексы
+    кладутся в общую память (multiprocessing.shared_memory), процессы
+    строят цепочки своих полос, а основной процесс сливает их merge_chains.
+    Результат тот же, что у divide_conquer_hull.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    n = len(points)
+    workers = workers or os.cpu_count()
+    parts = parts or workers
+    x = points[:, 0]
+    sample = x[np.random.default_rng(0).integers(0, n, sample_size)] if n > sample_size else x
+    cuts = np.unique(np.quantile(sample, np.linspace(0, 1, parts + 1)[1:-1])) if n else x
+    slab = np.searchsorted(cuts, x, side='right').astype(np.uint16)
+    # Устойчивая сортировка малых целых - поразрядная, O(n)
+    order = np.argsort(slab, kind='stable')
+    ends = np.cumsum(np.bincount(slab, minlength=len(cuts) + 1))
+    bounds = [(a, b) for a, b in zip([0] + ends[:-1].tolist(), ends.tolist()) if a < b]
+
+    coords_memory = shared_memory.SharedMemory(create=True, size=max(1, 16 * n))
+    index_memory = shared_memory.SharedMemory(create=True, size=max(1, 8 * n))
+    try:
+        coords = np.ndarray((n, 2), dtype=np.float64, buffer=coords_memory.buf)
+        np.take(points, order, axis=0, out=coords)
+        index = np.ndarray(n, dtype=np.int64, buffer=index_memory.buf)
+        index[:] = order
+        del coords, index
+        with Pool(workers) as pool:
+            results = pool.map(_slab_chains, [(coords_memory.name, index_memory.name, n, a, b, leaf_size)
+                                              for a, b in bounds])
+    finally:
+        coords_memory.close()
+        coords_memory.unlink()
+        index_memory.close()
+        index_memory.unlink()
+
+    chains = []
+    for sign, part in ((1, 0), (-1, 1)):
+        pieces = [result[part] for result in results]
+        vertices = np.concatenate(pieces) if pieces else np.empty(0, dtype=np.int64)
+        ends = np.cumsum([len(p) for p in pieces]).tolist()
+        blocks = list(zip([0] + ends[:-1], ends))
+        if not blocks:
+            return vertices
+        chain = merge_chains(points[vertices, 0].tolist(), points[vertices, 1].tolist(),
+                             np.arange(len(vertices)), blocks, sign)
+        chains.append(vertices[chain])
+    return join_chains(*chains)
+
+
+def edge_sides(points, pairs, tolerance=0, chunk_size=1 << 22):
+    """Сколько точек слева и справа от прямой i -> j для каждой пары (i, j).
+
+    Тот же подсчёт, что в convex_hull_brute_force: точки на прямой, в том числе
+    сами i и j, не считаются. При tolerance=0 сторона берётся по orientation
+    (точно), иначе на прямой - точки с |cross| < tolerance. Векторные
+    произведения считаются блоками пар на все точки, в блоке не больше
+    chunk_size чисел.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    pairs = np.asarray(pairs, dtype=np.int64).reshape(-1, 2)
+    x, y = points[:, 0], points[:, 1]
+    left = np.zeros(len(pairs), dtype=np.int64)
+    right = np.zeros(len(pairs), dtype=np.int64)
+    step = max(1, chunk_size // max(1, len(points)))
+    for start in range(0, len(pairs), step):
+        i, j = pairs[start:start + step, 0, None], pairs[start:start + step, 1, None]
+        if tolerance:
+            cross = cross_product((x[i], y[i]), (x[j], y[j]), (x, y))
+            cross = np.where(np.abs(cross) >= tolerance, cross, 0)
+        else:
+            cross = orientation((x[i], y[i]), (x[j], y[j]), (x, y))
+        left[start:start + step] = np.count_nonzero(cross > 0, axis=1)
+        right[start:start + step] = np.count_nonzero(cross < 0, axis=1)
+    return left, right
+
+
+def brute_force_edges(points, tolerance=0, chunk_size=1 << 22):
+    """Рёбра оболочки полным перебором пар, как convex_hull_brute_force, но без циклов Python.
+
+    Пара (i, j), i < j, - ребро, если все остальные точки по одну сторону
+    от прямой (точки на прямой не мешают, см. edge_sides).
+    O(n^3) действий: годится для сотен точек.
+    """
+    n = len(points)
+    i, j = np.triu_indices(n, 1)
+    pairs = np.column_stack((i, j))
+    left, right = edge_sides(points, pairs, tolerance, chunk_size)
+    return pairs[(left == 0) | (right == 0)]
+
+
+def is_convex_hull(points, hull_indices, chunk_size=1 << 22):
+    """Проверка, что hull_indices - выпуклая оболочка points в принятом виде.
+
+    Вершины различны и идут против часовой стрелки со строгим поворотом
+    влево (без точек на сторонах), а все точки лежат не правее каждой
+    стороны (edge_sides). Для одной вершины все точки совпадают с ней,
+    для двух - лежат на отрезке. Проверка O(n h), поэтому годится как
+    оракул для больших наборов точек.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    hull = np.asarray(hull_indices, dtype=np.int64)
+    if len(points) == 0 or len(hull) == 0:
+        return len(points) == len(hull)
+    if len(np.unique(points[hull], axis=0)) != len(hull):
+        return False
+    if len(hull) == 1:
+        return bool((points == points[hull[0]]).all())
+
+    edges = np.column_stack((hull, np.roll(hull, -1)))
+    _, right = edge_sides(points, edges, chunk_size=chunk_size)
+    if right.any():
+        return False
+    if len(hull) == 2:
+        # Все точки на прямой; внутри отрезка ли они, видно точно по координате,
+        # вдоль которой отрезок длиннее (по ней точки прямой упорядочены строго)
+        a, b = points[hull]
+        axis = int(np.argmax(np.abs(b - a)))
+        low, high = sorted((a[axis], b[axis]))
+        left, _ = edge_sides(points, edges[:1], chunk_size=chunk_size)
+        return bool(left[0] == 0 and ((points[:, axis] >= low) & (points[:, axis] <= high)).all())
+    o, a, b = points[hull], points[np.roll(hull, -1)], points[np.roll(hull, -2)]
+    return bool((orientation(o.T, a.T, b.T) > 0).all())